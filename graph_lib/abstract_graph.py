@@ -1,26 +1,118 @@
 import abc
+import ast
 import csv
-from typing import List, Dict
+import html
+import sys
+import zipfile
+from array import array
+from typing import List, Iterable, Iterator, Optional, Tuple
+
+# Buffer de escrita dos CSVs exportados (1 MiB)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+def _bfs_count(indptr, indices, rev_indptr, rev_indices, n: int, src: int) -> int:
+    """
+    BFS sobre os arrays CSR (arestas de saída e de entrada), ignorando a direção.
+    Retorna quantos vértices são alcançados a partir de src.
+    """
+    visited = bytearray(n)
+    visited[src] = 1
+    queue = [src]
+    head = 0
+    while head < len(queue):
+        curr = queue[head]
+        head += 1
+        for w in indices[indptr[curr]:indptr[curr + 1]]:
+            if not visited[w]:
+                visited[w] = 1
+                queue.append(w)
+        for w in rev_indices[rev_indptr[curr]:rev_indptr[curr + 1]]:
+            if not visited[w]:
+                visited[w] = 1
+                queue.append(w)
+    return len(queue)
+
+def _npy_bytes(values: array, shape: Tuple[int, ...]) -> bytes:
+    """
+    Serializa um array no formato .npy (versão 1.0) do NumPy, sem depender do NumPy.
+    """
+    kind = 'f' if values.typecode in 'fd' else 'i'
+    descr = f"<{kind}{values.itemsize}"
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape!r}, }}"
+    # Magic (6) + versão (2) + tamanho do header (2) + header + '\n' alinhados em 64 bytes
+    pad = -(10 + len(header) + 1) % 64
+    header = header + ' ' * pad + '\n'
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1') + values.tobytes()
+
+# dtype do .npy -> typecode do array.array
+NPY_TYPECODES = {'<i1': 'b', '|i1': 'b', '<i4': 'i', '<i8': 'q', '<f4': 'f', '<f8': 'd'}
+
+def _npy_array(payload: bytes) -> array:
+    """
+    Lê de volta um .npy unidimensional gravado por _npy_bytes (ou pelo NumPy, little-endian).
+    """
+    if payload[:8] != b'\x93NUMPY\x01\x00':
+        raise ValueError("Formato .npy não suportado.")
+    header_len = int.from_bytes(payload[8:10], 'little')
+    header = ast.literal_eval(payload[10:10 + header_len].decode('latin1'))
+    typecode = NPY_TYPECODES.get(header['descr'])
+    if typecode is None or header['fortran_order'] or len(header['shape']) > 1:
+        raise ValueError(f"Array .npy não suportado: {header}")
+    values = array(typecode)
+    values.frombytes(payload[10 + header_len:])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
 
 class AbstractGraph(abc.ABC):
     def __init__(self, num_vertices: int):
         self.num_vertices = num_vertices
-        self._vertex_weights: Dict[int, float] = {i: 1.0 for i in range(num_vertices)}
-        self._vertex_labels: Dict[int, str] = {i: f"Node_{i}" for i in range(num_vertices)}
+        # Contador de arestas mantido pelas implementações concretas
+        self._edge_count = 0
+        # Contador de versão: incrementado a cada alteração (arestas, pesos ou rótulos),
+        # permite que estruturas derivadas (ex.: snapshots do analisador) detectem dados obsoletos
+        self._version = 0
+        # Índices densos em [0, n): listas indexadas no lugar de dicionários
+        # Pesos dos vértices em um array('d') contíguo (8 bytes por vértice, sem objetos float)
+        self._vertex_weights: array = array('d', [1.0]) * num_vertices
+        self._vertex_labels: List[str] = [f"Node_{i}" for i in range(num_vertices)]
 
     def set_vertex_label(self, v: int, label: str):
-        self._validate_index(v)
+        self._validate_vertex(v)
         self._vertex_labels[v] = label
+        self._version += 1
 
     def get_vertex_label(self, v: int) -> str:
-        self._validate_index(v)
-        return self._vertex_labels.get(v, str(v))
+        self._validate_vertex(v)
+        return self._vertex_labels[v]
+
+    @property
+    def vertex_count(self) -> int:
+        return self.num_vertices
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    def __contains__(self, edge: Tuple[int, int]) -> bool:
+        """Permite `(u, v) in grafo`; índices fora do intervalo retornam False em vez de erro."""
+        u, v = edge
+        n = self.num_vertices
+        return 0 <= u < n and 0 <= v < n and self._has_edge_unchecked(u, v)
 
     def _validate_index(self, *indices):
         for idx in indices:
             if idx < 0 or idx >= self.num_vertices:
                 raise IndexError(f"Índice {idx} inválido. Esperado entre 0 e {self.num_vertices - 1}.")
 
+    def _validate_vertex(self, idx: int):
+        # Versão de um único índice, sem o laço sobre *args
+        if not 0 <= idx < self.num_vertices:
+            raise IndexError(f"Índice {idx} inválido. Esperado entre 0 e {self.num_vertices - 1}.")
+
     @abc.abstractmethod
     def getVertexCount(self) -> int: pass
 
@@ -43,7 +135,28 @@ class AbstractGraph(abc.ABC):
     def setEdgeWeight(self, u: int, v: int, w: float) -> None: pass
 
     @abc.abstractmethod
-    def getNeighbors(self, u: int) -> List[int]: pass
+    def getNeighbors(self, u: int) -> Iterable[int]:
+        """
+        Itera sobre os sucessores de u sem copiar a lista de adjacência.
+        Não altere o grafo durante a iteração; use getNeighborsList para uma cópia.
+        """
+
+    @abc.abstractmethod
+    def getPredecessors(self, u: int) -> List[int]: pass
+
+    # Variantes sem validação de índice, para laços internos que já garantem 0 <= u, v < n
+
+    @abc.abstractmethod
+    def _has_edge_unchecked(self, u: int, v: int) -> bool: pass
+
+    @abc.abstractmethod
+    def _get_edge_weight_unchecked(self, u: int, v: int) -> float: pass
+
+    @abc.abstractmethod
+    def _get_neighbors_unchecked(self, u: int) -> List[int]: pass
+
+    @abc.abstractmethod
+    def _get_predecessors_unchecked(self, u: int) -> List[int]: pass
 
     # Métodos Concretos
 
@@ -55,83 +168,183 @@ class AbstractGraph(abc.ABC):
 
     def isDivergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
         self._validate_index(u1, v1, u2, v2)
-        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+        if not (self._has_edge_unchecked(u1, v1) and self._has_edge_unchecked(u2, v2)):
             return False
         return (u1 == u2) and (v1 != v2)
 
     def isConvergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
         self._validate_index(u1, v1, u2, v2)
-        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+        if not (self._has_edge_unchecked(u1, v1) and self._has_edge_unchecked(u2, v2)):
             return False
         return (v1 == v2) and (u1 != u2)
 
     def isIncident(self, u: int, v: int, x: int) -> bool:
         self._validate_index(u, v, x)
-        if not self.hasEdge(u, v):
+        if not self._has_edge_unchecked(u, v):
             return False
         return x == u or x == v
 
+    def getNeighborsList(self, u: int) -> List[int]:
+        """Cópia materializada dos sucessores de u (pode ser alterada livremente)."""
+        self._validate_vertex(u)
+        return self._get_neighbors_unchecked(u)
+
     def getVertexInDegree(self, u: int) -> int:
-        self._validate_index(u)
-        degree = 0
-        for i in range(self.num_vertices):
-            if self.hasEdge(i, u):
-                degree += 1
-        return degree
+        self._validate_vertex(u)
+        return len(self._get_predecessors_unchecked(u))
 
     def getVertexOutDegree(self, u: int) -> int:
-        self._validate_index(u)
-        return len(self.getNeighbors(u))
+        self._validate_vertex(u)
+        return len(self._get_neighbors_unchecked(u))
+
+    def getVertexOutDegrees(self) -> List[int]:
+        """Graus de saída de todos os vértices, indexados pelo id."""
+        return [len(self._get_neighbors_unchecked(u)) for u in range(self.num_vertices)]
+
+    def getVertexInDegrees(self) -> List[int]:
+        """Graus de entrada de todos os vértices, indexados pelo id."""
+        return [len(self._get_predecessors_unchecked(u)) for u in range(self.num_vertices)]
 
     def setVertexWeight(self, v: int, w: float):
-        self._validate_index(v)
+        self._validate_vertex(v)
         self._vertex_weights[v] = w
+        self._version += 1
 
     def getVertexWeight(self, v: int) -> float:
-        self._validate_index(v)
-        return self._vertex_weights.get(v, 1.0)
+        self._validate_vertex(v)
+        return self._vertex_weights[v]
+
+    def getVertexWeights(self) -> array:
+        """
+        Pesos de todos os vértices, indexados pelo id, sem cópia (array('d'), compatível com
+        memoryview/numpy.frombuffer). Use setVertexWeight para alterar.
+        """
+        return self._vertex_weights
+
+    def addEdges(self, pairs: Iterable[Tuple[int, int]], weights: Optional[Iterable[float]] = None) -> int:
+        """
+        Adiciona várias arestas de uma vez e retorna quantas eram novas.
+        Com weights, cada par recebe o peso correspondente (inclusive arestas já existentes).
+        Laços (u == v) são ignorados, como em addEdge.
+        """
+        before = self._edge_count
+        if weights is None:
+            for u, v in pairs:
+                self.addEdge(u, v)
+        else:
+            for (u, v), w in zip(pairs, weights):
+                self.addEdge(u, v)
+                if u != v:
+                    self.setEdgeWeight(u, v, w)
+        return self._edge_count - before
+
+    def iterEdges(self) -> Iterator[Tuple[int, int, float]]:
+        """
+        Percorre todas as arestas como tuplas (u, v, peso).
+        As implementações concretas sobrescrevem lendo direto da estrutura interna.
+        """
+        for u in range(self.num_vertices):
+            for v in self._get_neighbors_unchecked(u):
+                yield u, v, self._get_edge_weight_unchecked(u, v)
+
+    def toCSR(self, transpose: bool = False):
+        """
+        Retorna (indptr, indices, weights) em formato CSR.
+        Com transpose=True, a linha u lista os predecessores de u.
+        """
+        indptr = array('q', [0])
+        indices = array('i')
+        weights = array('d')
+        for u in range(self.num_vertices):
+            if transpose:
+                adj = self._get_predecessors_unchecked(u)
+                weights.extend(self._get_edge_weight_unchecked(v, u) for v in adj)
+            else:
+                adj = self._get_neighbors_unchecked(u)
+                weights.extend(self._get_edge_weight_unchecked(u, v) for v in adj)
+            indices.extend(adj)
+            indptr.append(len(indices))
+        return indptr, indices, weights
 
     def isConnected(self) -> bool:
-        if self.getVertexCount() == 0: return True
-        visited = set()
-        queue = [0]
-        visited.add(0)
-        
-        while queue:
-            curr = queue.pop(0)
-            for neighbor in self.getNeighbors(curr):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-            for i in range(self.num_vertices):
-                if i not in visited and self.hasEdge(i, curr):
-                    visited.add(i)
-                    queue.append(i)
-        return len(visited) == self.num_vertices
+        if self.num_vertices == 0: return True
+        # Conectividade fraca: a BFS segue arestas de saída e de entrada
+        indptr, indices, _ = self.toCSR()
+        rev_indptr, rev_indices, _ = self.toCSR(transpose=True)
+        return _bfs_count(indptr, indices, rev_indptr, rev_indices, self.num_vertices, 0) == self.num_vertices
 
     def isEmptyGraph(self) -> bool:
-        return self.getEdgeCount() == 0
+        return self._edge_count == 0
 
     def isCompleteGraph(self) -> bool:
-        n = self.getVertexCount()
-        return self.getEdgeCount() == n * (n - 1)
+        n = self.num_vertices
+        return self._edge_count == n * (n - 1)
 
     def exportToGEPHI(self, path: str):
         nodes_path = path.replace(".csv", "_nodes.csv") if ".csv" in path else path + "_nodes.csv"
         edges_path = path.replace(".csv", "_edges.csv") if ".csv" in path else path + "_edges.csv"
         try:
-            with open(nodes_path, mode='w', newline='', encoding='utf-8') as f:
+            with open(nodes_path, mode='w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(["Id", "Label", "Weight"])
-                for i in range(self.num_vertices):
-                    writer.writerow([i, self.get_vertex_label(i), self.getVertexWeight(i)])
+                writer.writerows(zip(range(self.num_vertices), self._vertex_labels, self._vertex_weights))
             
-            with open(edges_path, mode='w', newline='', encoding='utf-8') as f:
+            with open(edges_path, mode='w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(["Source", "Target", "Weight", "Type"])
-                for u in range(self.num_vertices):
-                    for v in self.getNeighbors(u):
-                        writer.writerow([u, v, self.getEdgeWeight(u, v), "Directed"])
+                writer.writerows((u, v, w, "Directed") for u, v, w in self.iterEdges())
             print(f"Exportado: {nodes_path}, {edges_path}")
         except IOError as e:
-            print(f"Erro ao exportar: {e}")
\ No newline at end of file
+            print(f"Erro ao exportar: {e}")
+
+    def exportToGEXF(self, path: str):
+        """
+        Exporta para GEXF 1.2 (formato nativo do Gephi), gravando nó a nó e aresta a aresta,
+        sem montar a árvore XML em memória. O peso do vértice vai como atributo "Weight".
+        Rótulos escapados com html.escape (válido em XML e bem mais leve de importar que xml.sax).
+        """
+        if not path.endswith(".gexf"):
+            path += ".gexf"
+        try:
+            with open(path, mode='w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                write = f.write
+                write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                      '<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n'
+                      '  <graph mode="static" defaultedgetype="directed">\n'
+                      '    <attributes class="node">\n'
+                      '      <attribute id="0" title="Weight" type="double"/>\n'
+                      '    </attributes>\n'
+                      '    <nodes>\n')
+                for v, (label, weight) in enumerate(zip(self._vertex_labels, self._vertex_weights)):
+                    write(f'      <node id="{v}" label="{html.escape(str(label))}">'
+                          f'<attvalues><attvalue for="0" value="{weight}"/></attvalues></node>\n')
+                write('    </nodes>\n'
+                      '    <edges>\n')
+                for i, (u, v, w) in enumerate(self.iterEdges()):
+                    write(f'      <edge id="{i}" source="{u}" target="{v}" weight="{w}"/>\n')
+                write('    </edges>\n'
+                      '  </graph>\n'
+                      '</gexf>\n')
+            print(f"Exportado: {path}")
+        except IOError as e:
+            print(f"Erro ao exportar: {e}")
+
+    def exportToGraphBLAS(self, path: str):
+        """
+        Exporta a matriz de adjacência em CSR binário (.npz com indptr, indices, weights e n),
+        no mesmo layout de numpy.savez. Pode ser carregado com numpy.load e repassado a
+        python-graphblas/LAGraph (ex.: Matrix.from_csr) para BFS, componentes e PageRank em grafos grandes.
+        """
+        if not path.endswith(".npz"):
+            path += ".npz"
+        indptr, indices, weights = self.toCSR()
+        n = self.num_vertices
+        try:
+            with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED) as zf:
+                zf.writestr("indptr.npy", _npy_bytes(indptr, (n + 1,)))
+                zf.writestr("indices.npy", _npy_bytes(indices, (len(indices),)))
+                zf.writestr("weights.npy", _npy_bytes(weights, (len(weights),)))
+                zf.writestr("n.npy", _npy_bytes(array('q', [n]), ()))
+            print(f"Exportado: {path}")
+        except IOError as e:
+            print(f"Erro ao exportar: {e}")
@@ -1,11 +1,78 @@
-from typing import List, Dict
+from array import array
+from typing import Dict, List, Set, Iterable, Iterator, Optional, Tuple
 from .abstract_graph import AbstractGraph
 
 class AdjacencyListGraph(AbstractGraph):
     def __init__(self, numVertices: int):
         super().__init__(numVertices)
-        self._adj_list: List[Dict[int, float]] = [{} for _ in range(numVertices)]
-        self._edge_count = 0
+        # Estrutura de arrays (SoA): vizinhos e pesos em arrays paralelos por vértice,
+        # para que percursos que só usam a topologia não toquem nos pesos.
+        # Os contêineres de cada vértice são alocados na primeira aresta (de saída ou de entrada);
+        # até lá, a posição guarda None (~400 bytes a menos por vértice isolado)
+        self._neighbors: List[Optional[array]] = [None] * numVertices
+        self._weights: List[Optional[array]] = [None] * numVertices
+        # Índice companheiro (vizinho -> posição nos arrays) para pertinência e acesso ao peso em O(1)
+        self._adj_pos: List[Optional[Dict[int, int]]] = [None] * numVertices
+        # Adjacência reversa: predecessores de cada vértice
+        self._rev_adj: List[Optional[Set[int]]] = [None] * numVertices
+        # Representação CSR (somente leitura), gerada sob demanda por freeze()
+        self._csr_indptr = None
+        self._csr_indices = None
+        self._csr_weights = None
+
+    @classmethod
+    def fromCSR(cls, numVertices: int, indptr: Iterable[int], indices: Iterable[int],
+                weights: Optional[Iterable[float]] = None) -> "AdjacencyListGraph":
+        """
+        Constrói o grafo de uma vez a partir de arrays CSR (vizinhos de u em indices[indptr[u]:indptr[u + 1]]),
+        sem uma chamada a addEdge por aresta; sem weights, todas as arestas têm peso 1.0.
+        As linhas não podem ter vizinhos repetidos nem laços. O CSR recebido vira a representação congelada.
+        """
+        graph = cls(numVertices)
+        indptr = array('q', indptr)
+        indices = array('i', indices)
+        weights = array('d', weights) if weights is not None else array('d', [1.0]) * len(indices)
+        m = len(indices)
+        if len(indptr) != numVertices + 1 or indptr[0] != 0 or indptr[-1] != m or len(weights) != m:
+            raise ValueError("Arrays CSR inconsistentes.")
+        if m and not (0 <= min(indices) and max(indices) < numVertices):
+            graph._validate_index(min(indices), max(indices))
+        neighbors, adj_weights, adj_pos, rev_adj = graph._neighbors, graph._weights, graph._adj_pos, graph._rev_adj
+        for u in range(numVertices):
+            start, end = indptr[u], indptr[u + 1]
+            if start == end:
+                continue
+            row = indices[start:end]
+            positions = dict(zip(row, range(end - start)))
+            if len(positions) != end - start or u in positions:
+                raise ValueError(f"Linha {u} do CSR tem vizinhos repetidos ou laço.")
+            neighbors[u] = row
+            adj_weights[u] = weights[start:end]
+            adj_pos[u] = positions
+            for v in row:
+                preds = rev_adj[v]
+                if preds is None:
+                    preds = rev_adj[v] = set()
+                preds.add(u)
+        graph._edge_count = m
+        graph._version += 1
+        graph._csr_indptr, graph._csr_indices, graph._csr_weights = indptr, indices, weights
+        return graph
+
+    def _append_edge(self, u: int, v: int, w: float) -> None:
+        """Anexa a aresta nova (u, v), alocando as linhas de u e os predecessores de v na primeira vez."""
+        positions = self._adj_pos[u]
+        if positions is None:
+            positions = self._adj_pos[u] = {}
+            self._neighbors[u] = array('i')
+            self._weights[u] = array('d')
+        positions[v] = len(positions)
+        self._neighbors[u].append(v)
+        self._weights[u].append(w)
+        preds = self._rev_adj[v]
+        if preds is None:
+            preds = self._rev_adj[v] = set()
+        preds.add(u)
 
     def getVertexCount(self) -> int:
         return self.num_vertices
@@ -14,33 +81,182 @@ class AdjacencyListGraph(AbstractGraph):
         return self._edge_count
 
     def hasEdge(self, u: int, v: int) -> bool:
-        self._validate_index(u, v)
-        return v in self._adj_list[u]
+        # Checagem de limites inline (sem o laço de _validate_index) e sem a chamada extra a _has_edge_unchecked
+        n = self.num_vertices
+        if not (0 <= u < n and 0 <= v < n):
+            self._validate_index(u, v)
+        positions = self._adj_pos[u]
+        return positions is not None and v in positions
+
+    def _has_edge_unchecked(self, u: int, v: int) -> bool:
+        positions = self._adj_pos[u]
+        return positions is not None and v in positions
 
     def addEdge(self, u: int, v: int) -> None:
-        self._validate_index(u, v)
+        n = self.num_vertices
+        if not (0 <= u < n and 0 <= v < n):
+            self._validate_index(u, v)
         if u == v: return
-        if v not in self._adj_list[u]:
-            self._adj_list[u][v] = 1.0
+        positions = self._adj_pos[u]
+        if positions is None or v not in positions:
+            self._append_edge(u, v, 1.0)
             self._edge_count += 1
+            self._invalidate_csr()
+
+    def addEdges(self, pairs: Iterable[Tuple[int, int]], weights: Optional[Iterable[float]] = None) -> int:
+        n = self.num_vertices
+        adj_pos, adj_weights = self._adj_pos, self._weights
+        items = zip(pairs, weights) if weights is not None else ((pair, 1.0) for pair in pairs)
+        added = 0
+        changed = False
+        try:
+            for (u, v), w in items:
+                if not (0 <= u < n and 0 <= v < n):
+                    self._validate_index(u, v)
+                if u == v:
+                    continue
+                positions = adj_pos[u]
+                pos = positions.get(v) if positions is not None else None
+                if pos is None:
+                    self._append_edge(u, v, w)
+                    added += 1
+                    changed = True
+                elif weights is not None:
+                    adj_weights[u][pos] = w
+                    changed = True
+        finally:
+            self._edge_count += added
+            if changed:
+                self._invalidate_csr()
+        return added
 
     def removeEdge(self, u: int, v: int) -> None:
-        self._validate_index(u, v)
-        if v in self._adj_list[u]:
-            del self._adj_list[u][v]
+        n = self.num_vertices
+        if not (0 <= u < n and 0 <= v < n):
+            self._validate_index(u, v)
+        positions = self._adj_pos[u]
+        pos = positions.get(v) if positions is not None else None
+        if pos is not None:
+            del positions[v]
+            neighbors = self._neighbors[u]
+            del neighbors[pos]
+            del self._weights[u][pos]
+            # Os vizinhos seguintes recuam uma posição (a ordem de inserção é preservada);
+            # update com zip renumera o trecho em C, sem um laço Python
+            positions.update(zip(neighbors[pos:], range(pos, len(neighbors))))
+            self._rev_adj[v].discard(u)
             self._edge_count -= 1
+            self._invalidate_csr()
 
     def setEdgeWeight(self, u: int, v: int, w: float) -> None:
-        self._validate_index(u, v)
-        if v in self._adj_list[u]:
-            self._adj_list[u][v] = w
+        n = self.num_vertices
+        if not (0 <= u < n and 0 <= v < n):
+            self._validate_index(u, v)
+        positions = self._adj_pos[u]
+        pos = positions.get(v) if positions is not None else None
+        if pos is not None:
+            self._weights[u][pos] = w
+            self._invalidate_csr()
         else:
             raise ValueError("Aresta não existe.")
 
     def getEdgeWeight(self, u: int, v: int) -> float:
-        self._validate_index(u, v)
-        return self._adj_list[u].get(v, 0.0)
+        n = self.num_vertices
+        if not (0 <= u < n and 0 <= v < n):
+            self._validate_index(u, v)
+        return self._get_edge_weight_unchecked(u, v)
+
+    def _get_edge_weight_unchecked(self, u: int, v: int) -> float:
+        positions = self._adj_pos[u]
+        pos = positions.get(v) if positions is not None else None
+        return self._weights[u][pos] if pos is not None else 0.0
+
+    def getNeighbors(self, u: int) -> Iterable[int]:
+        self._validate_vertex(u)
+        if self._csr_indptr is not None:
+            return iter(self._csr_indices[self._csr_indptr[u]:self._csr_indptr[u + 1]])
+        neighbors = self._neighbors[u]
+        return iter(neighbors) if neighbors is not None else iter(())
+
+    def _get_neighbors_unchecked(self, u: int) -> List[int]:
+        if self._csr_indptr is not None:
+            return self._csr_indices[self._csr_indptr[u]:self._csr_indptr[u + 1]].tolist()
+        neighbors = self._neighbors[u]
+        return neighbors.tolist() if neighbors is not None else []
+
+    def getPredecessors(self, u: int) -> List[int]:
+        self._validate_vertex(u)
+        return self._get_predecessors_unchecked(u)
+
+    def _get_predecessors_unchecked(self, u: int) -> List[int]:
+        preds = self._rev_adj[u]
+        return list(preds) if preds is not None else []
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_vertex(u)
+        neighbors = self._neighbors[u]
+        return len(neighbors) if neighbors is not None else 0
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_vertex(u)
+        preds = self._rev_adj[u]
+        return len(preds) if preds is not None else 0
+
+    def getVertexOutDegrees(self) -> List[int]:
+        return [len(neighbors) if neighbors is not None else 0 for neighbors in self._neighbors]
+
+    def getVertexInDegrees(self) -> List[int]:
+        return [len(preds) if preds is not None else 0 for preds in self._rev_adj]
+
+    def iterEdges(self) -> Iterator[Tuple[int, int, float]]:
+        for u, neighbors in enumerate(self._neighbors):
+            if neighbors is None:
+                continue
+            for v, w in zip(neighbors, self._weights[u]):
+                yield u, v, w
+
+    # Representação CSR
+
+    def freeze(self) -> None:
+        """
+        Compacta a lista de adjacência em três arrays contíguos (CSR):
+        os vizinhos de u ficam em indices[indptr[u]:indptr[u + 1]].
+        Qualquer alteração no grafo descarta a representação.
+        """
+        if self._csr_indptr is not None:
+            return
+        indptr = array('q', [0])
+        indices = array('i')
+        weights = array('d')
+        for neighbors, neighbor_weights in zip(self._neighbors, self._weights):
+            if neighbors is not None:
+                indices.extend(neighbors)
+                weights.extend(neighbor_weights)
+            indptr.append(len(indices))
+        self._csr_indptr = indptr
+        self._csr_indices = indices
+        self._csr_weights = weights
+
+    def toCSR(self, transpose: bool = False):
+        if transpose:
+            indptr = array('q', [0])
+            indices = array('i')
+            weights = array('d')
+            for v, preds in enumerate(self._rev_adj):
+                if preds is not None:
+                    indices.extend(preds)
+                    weights.extend(self._get_edge_weight_unchecked(u, v) for u in preds)
+                indptr.append(len(indices))
+            return indptr, indices, weights
+        self.freeze()
+        return self._csr_indptr, self._csr_indices, self._csr_weights
+
+    def isFrozen(self) -> bool:
+        return self._csr_indptr is not None
 
-    def getNeighbors(self, u: int) -> List[int]:
-        self._validate_index(u)
-        return list(self._adj_list[u].keys())
\ No newline at end of file
+    def _invalidate_csr(self):
+        # Toda alteração passa por aqui
+        self._version += 1
+        self._csr_indptr = None
+        self._csr_indices = None
+        self._csr_weights = None
@@ -1,11 +1,44 @@
-from typing import List, Optional
+from array import array
+from typing import List, Iterable, Iterator, Optional, Tuple
 from .abstract_graph import AbstractGraph
 
 class AdjacencyMatrixGraph(AbstractGraph):
-    def __init__(self, numVertices: int):
+    def __init__(self, numVertices: int, undirected: bool = False):
         super().__init__(numVertices)
-        self._matrix: List[List[Optional[float]]] = [[None] * numVertices for _ in range(numVertices)]
-        self._edge_count = 0
+        self.undirected = undirected
+        if undirected:
+            # Grafo simétrico: só o triângulo superior (i < j), em vetores planos de n(n-1)/2 células.
+            # Cada aresta {u, v} conta como os arcos (u, v) e (v, u), mantendo a semântica dirigida da biblioteca.
+            size = numVertices * (numVertices - 1) // 2
+            self._tri_present = bytearray(size)
+            self._tri_weights = array('d', bytes(8 * size))
+            self._present = None
+            self._matrix = None
+        else:
+            # Máscara de presença (1 byte por célula) separada dos pesos;
+            # cada linha de pesos é um array('d') contíguo (8 bytes por célula, sem objetos float),
+            # alocado só quando alguma aresta da linha recebe peso diferente de 1.0 (None = todas com peso 1.0).
+            # Um grafo sem pesos ocupa 1 byte por célula em vez de 9
+            self._present: List[bytearray] = [bytearray(numVertices) for _ in range(numVertices)]
+            self._matrix: List[Optional[array]] = [None] * numVertices
+
+    def _weight_row(self, u: int) -> array:
+        """Linha de pesos de u, alocada na primeira escrita com os pesos 1.0 das arestas já existentes."""
+        row = self._matrix[u]
+        if row is None:
+            row = array('d', bytes(8 * self.num_vertices))
+            present = self._present[u]
+            v = present.find(1)
+            while v != -1:
+                row[v] = 1.0
+                v = present.find(1, v + 1)
+            self._matrix[u] = row
+        return row
+
+    def _tri_index(self, i: int, j: int) -> int:
+        if i > j:
+            i, j = j, i
+        return i * (2 * self.num_vertices - i - 1) // 2 + j - i - 1
 
     def getVertexCount(self) -> int:
         return self.num_vertices
@@ -15,32 +48,193 @@ class AdjacencyMatrixGraph(AbstractGraph):
 
     def hasEdge(self, u: int, v: int) -> bool:
         self._validate_index(u, v)
-        return self._matrix[u][v] is not None
+        return self._has_edge_unchecked(u, v)
+
+    def _has_edge_unchecked(self, u: int, v: int) -> bool:
+        if self.undirected:
+            return u != v and self._tri_present[self._tri_index(u, v)] == 1
+        return self._present[u][v] == 1
 
     def addEdge(self, u: int, v: int) -> None:
         self._validate_index(u, v)
         if u == v: return
-        if self._matrix[u][v] is None:
-            self._matrix[u][v] = 1.0
+        if self.undirected:
+            k = self._tri_index(u, v)
+            if not self._tri_present[k]:
+                self._tri_present[k] = 1
+                self._tri_weights[k] = 1.0
+                self._edge_count += 2
+                self._version += 1
+        elif not self._present[u][v]:
+            self._present[u][v] = 1
+            row = self._matrix[u]
+            if row is not None:
+                row[v] = 1.0
             self._edge_count += 1
+            self._version += 1
+
+    def addEdges(self, pairs: Iterable[Tuple[int, int]], weights: Optional[Iterable[float]] = None) -> int:
+        if self.undirected:
+            return super().addEdges(pairs, weights)
+        n = self.num_vertices
+        present, matrix = self._present, self._matrix
+        items = zip(pairs, weights) if weights is not None else ((pair, 1.0) for pair in pairs)
+        added = 0
+        try:
+            for (u, v), w in items:
+                if not (0 <= u < n and 0 <= v < n):
+                    self._validate_index(u, v)
+                if u == v:
+                    continue
+                row = present[u]
+                if not row[v]:
+                    row[v] = 1
+                    added += 1
+                elif weights is None:
+                    continue
+                weight_row = matrix[u]
+                if weight_row is not None:
+                    weight_row[v] = w
+                elif w != 1.0:
+                    self._weight_row(u)[v] = w
+        finally:
+            self._edge_count += added
+            self._version += 1
+        return added
 
     def removeEdge(self, u: int, v: int) -> None:
         self._validate_index(u, v)
-        if self._matrix[u][v] is not None:
-            self._matrix[u][v] = None
+        if u == v: return
+        if self.undirected:
+            k = self._tri_index(u, v)
+            if self._tri_present[k]:
+                self._tri_present[k] = 0
+                self._tri_weights[k] = 0.0
+                self._edge_count -= 2
+                self._version += 1
+        elif self._present[u][v]:
+            self._present[u][v] = 0
+            row = self._matrix[u]
+            if row is not None:
+                row[v] = 0.0
             self._edge_count -= 1
+            self._version += 1
 
     def setEdgeWeight(self, u: int, v: int, w: float) -> None:
         self._validate_index(u, v)
-        if self._matrix[u][v] is not None:
-            self._matrix[u][v] = w
-        else:
+        if not self._has_edge_unchecked(u, v):
             raise ValueError("Aresta não existe.")
+        if self.undirected:
+            self._tri_weights[self._tri_index(u, v)] = w
+        elif self._matrix[u] is not None or w != 1.0:
+            self._weight_row(u)[v] = w
+        self._version += 1
 
     def getEdgeWeight(self, u: int, v: int) -> float:
         self._validate_index(u, v)
-        return self._matrix[u][v] if self._matrix[u][v] is not None else 0.0
+        return self._get_edge_weight_unchecked(u, v)
+
+    def _get_edge_weight_unchecked(self, u: int, v: int) -> float:
+        if self.undirected:
+            if u == v: return 0.0
+            k = self._tri_index(u, v)
+            return self._tri_weights[k] if self._tri_present[k] else 0.0
+        if not self._present[u][v]:
+            return 0.0
+        row = self._matrix[u]
+        return row[v] if row is not None else 1.0
+
+    def getNeighbors(self, u: int) -> Iterable[int]:
+        self._validate_vertex(u)
+        if self.undirected:
+            return iter(self._tri_neighbors(u))
+        return self._iter_row(u)
+
+    def _iter_row(self, u: int) -> Iterator[int]:
+        row = self._present[u]
+        v = row.find(1)
+        while v != -1:
+            yield v
+            v = row.find(1, v + 1)
+
+    def _get_neighbors_unchecked(self, u: int) -> List[int]:
+        if self.undirected:
+            return self._tri_neighbors(u)
+        # bytearray.find varre a linha em C, pulando as células vazias
+        row = self._present[u]
+        neighbors = []
+        v = row.find(1)
+        while v != -1:
+            neighbors.append(v)
+            v = row.find(1, v + 1)
+        return neighbors
+
+    def _tri_neighbors(self, u: int) -> List[int]:
+        n = self.num_vertices
+        tri = self._tri_present
+        # Parte da coluna (i < u): uma célula por linha anterior
+        neighbors = [i for i in range(u) if tri[i * (2 * n - i - 1) // 2 + u - i - 1]]
+        # Parte da linha (v > u): trecho contíguo, varrido com find
+        start = u * (2 * n - u - 1) // 2
+        end = start + n - u - 1
+        offset = u + 1 - start
+        k = tri.find(1, start, end)
+        while k != -1:
+            neighbors.append(k + offset)
+            k = tri.find(1, k + 1, end)
+        return neighbors
+
+    def getPredecessors(self, u: int) -> List[int]:
+        self._validate_vertex(u)
+        return self._get_predecessors_unchecked(u)
+
+    def _get_predecessors_unchecked(self, u: int) -> List[int]:
+        if self.undirected:
+            return self._tri_neighbors(u)
+        return [i for i, row in enumerate(self._present) if row[u]]
+
+    def iterEdges(self) -> Iterator[Tuple[int, int, float]]:
+        if self.undirected:
+            weights = self._tri_weights
+            for u in range(self.num_vertices):
+                for v in self._tri_neighbors(u):
+                    yield u, v, weights[self._tri_index(u, v)]
+            return
+        for u, row in enumerate(self._present):
+            weights = self._matrix[u]
+            v = row.find(1)
+            while v != -1:
+                yield u, v, weights[v] if weights is not None else 1.0
+                v = row.find(1, v + 1)
+
+    def _tri_degree(self, u: int) -> int:
+        n = self.num_vertices
+        tri = self._tri_present
+        start = u * (2 * n - u - 1) // 2
+        column = sum(tri[i * (2 * n - i - 1) // 2 + u - i - 1] for i in range(u))
+        return column + tri.count(1, start, start + n - u - 1)
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_vertex(u)
+        if self.undirected:
+            return self._tri_degree(u)
+        return self._present[u].count(1)
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_vertex(u)
+        if self.undirected:
+            return self._tri_degree(u)
+        return sum(row[u] for row in self._present)
+
+    def getVertexOutDegrees(self) -> List[int]:
+        if self.undirected:
+            return [self._tri_degree(u) for u in range(self.num_vertices)]
+        return [row.count(1) for row in self._present]
 
-    def getNeighbors(self, u: int) -> List[int]:
-        self._validate_index(u)
-        return [v for v in range(self.num_vertices) if self._matrix[u][v] is not None]
\ No newline at end of file
+    def getVertexInDegrees(self) -> List[int]:
+        if self.undirected:
+            return [self._tri_degree(u) for u in range(self.num_vertices)]
+        # Soma das colunas da máscara em uma única passada
+        if self.num_vertices == 0:
+            return []
+        return [sum(column) for column in zip(*self._present)]
@@ -1,7 +1,8 @@
 import sys
 import os
+import heapq
 import signal
-from mining.github_miner import GitHubMiner
+from mining.github_miner import GitHubMiner, GRAPH_GROUPS
 from mining.analyzer import GraphAnalyzer
 from graph_lib.abstract_graph import AbstractGraph
 
@@ -25,13 +26,21 @@ def signal_handler(sig, frame):
     print("Saindo do programa...")
     sys.exit(0)
 
+def print_current_config(miner: GitHubMiner):
+    """
+    Mostra o repositório e o token do miner ativo. O miner é sempre criado a partir
+    da configuração salva (ou junto com ela, na opção 1), então o arquivo não é relido.
+    """
+    print(f"\nConfiguração atual: {miner.repo_owner}/{miner.repo_name}")
+    print(f"Token: {'Configurado' if miner.token else 'Não configurado'}")
+
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 def print_top_metrics(metrics: dict, title: str, top_n=5):
     print(f"\n--- Top {top_n} {title} ---")
-    sorted_items = sorted(metrics.items(), key=lambda x: x[1], reverse=True)
-    for k, v in sorted_items[:top_n]:
+    # Seleção parcial: O(V log top_n) em vez de ordenar o dicionário inteiro
+    for k, v in heapq.nlargest(top_n, metrics.items(), key=lambda x: x[1]):
         val = f"{v:.4f}" if isinstance(v, float) else v
         print(f"{k}: {val}")
 
@@ -50,9 +59,8 @@ def main_menu():
     miner = GitHubMiner.create_from_config()
     if miner:
         current_miner = miner
-        config = GitHubMiner.load_config()
-        print(f"Configuração carregada: {config['repo_owner']}/{config['repo_name']}")
-        if config.get('token'):
+        print(f"Configuração carregada: {miner.repo_owner}/{miner.repo_name}")
+        if miner.token:
             print("Token GitHub configurado.")
         else:
             print("Sem token GitHub (limitações de rate limit podem aplicar).")
@@ -75,10 +83,7 @@ def main_menu():
         
         # Mostrar configuração atual se existir
         if miner:
-            config = GitHubMiner.load_config()
-            if config:
-                print(f"\nConfiguração atual: {config['repo_owner']}/{config['repo_name']}")
-                print(f"Token: {'Configurado' if config.get('token') else 'Não configurado'}")
+            print_current_config(miner)
         
         opt = input("\nEscolha uma opção: ")
 
@@ -86,11 +91,8 @@ def main_menu():
             print("\n--- Configuração do GitHub ---")
             
             # Mostrar configuração atual se existir
-            current_config = GitHubMiner.load_config()
-            if current_config:
-                print(f"Configuração atual:")
-                print(f"  Repositório: {current_config['repo_owner']}/{current_config['repo_name']}")
-                print(f"  Token: {'Configurado' if current_config.get('token') else 'Não configurado'}")
+            if miner:
+                print_current_config(miner)
                 print()
             
             owner = input("Dono do Repositório (ex: facebook): ").strip()
@@ -105,7 +107,9 @@ def main_menu():
             # Salvar configuração
             GitHubMiner.save_config(owner, repo, token if token else None)
             
-            # Criar nova instância
+            # Criar nova instância (liberando as conexões da anterior)
+            if miner:
+                miner.close()
             miner = GitHubMiner(owner, repo, token if token else None)
             current_miner = miner  # Atualizar variável global para signal handler
             print("Configuração salva e aplicada!")
@@ -150,8 +154,9 @@ def main_menu():
                 print("Nenhum dado para salvar. Execute a mineração primeiro.")
                 continue
             
+            fmt = input("Formato (json/npz) [json]: ").strip().lower()
             print("Salvando dados manualmente...")
-            filename = miner.save_data_to_json()
+            filename = miner.save_data_to_npz() if fmt == 'npz' else miner.save_data_to_json()
             if filename:
                 print(f"Dados salvos com sucesso em: {filename}")
             input("Pressione Enter...")
@@ -160,9 +165,8 @@ def main_menu():
             if not miner or not miner.raw_interactions:
                 print("Nenhum dado minerado. Execute a opção 2 ou carregue dados salvos (opção 3).")
                 continue
-            grafo['comments'] = miner.get_graph_1_comments()
-            grafo['closed'] = miner.get_graph_2_issues_closed()
-            grafo['reviews'] = miner.get_graph_3_reviews_merges()
+            # Os três grafos em uma única passada pelas interações
+            grafo.update(miner.build_graphs({name: GRAPH_GROUPS[name] for name in ('comments', 'closed', 'reviews')}))
             
             print(f"Grafo 1 (Comentários): {grafo['comments'].getVertexCount()} nós, {grafo['comments'].getEdgeCount()} arestas.")
             print(f"Grafo 2 (Fechamentos): {grafo['closed'].getVertexCount()} nós, {grafo['closed'].getEdgeCount()} arestas.")
@@ -227,10 +231,19 @@ def main_menu():
             if grafo_integrado:
                 grafo_integrado.exportToGEPHI("grafo_integrado")
                 print("Arquivos CSV gerados.")
+                # GEXF (formato nativo do Gephi) só quando pedido
+                if input("Exportar também em GEXF (grafo integrado e individuais)? (s/N): ").strip().lower() == 's':
+                    grafo_integrado.exportToGEXF("grafo_integrado")
+                    # Grafos individuais, se já construídos (opção 5)
+                    for name, g in grafo.items():
+                        g.exportToGEXF(f"grafo_{name}")
+                    print("Arquivos GEXF gerados.")
             else:
                 print("Grafo não existe.")
 
         elif opt == '0':
+            if miner:
+                miner.close()
             sys.exit()
 
 if __name__ == "__main__":
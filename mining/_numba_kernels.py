@@ -0,0 +1,44 @@
+"""
+Laços numéricos compilados com numba para o backend "numba" do GraphAnalyzer.
+Este módulo só é importado quando esse backend é pedido; numba e numpy são opcionais.
+"""
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def pagerank_gauss_seidel(in_indptr, in_indices, inv_out, is_sink, d, max_iter, tol):
+    """
+    Mesma iteração de Gauss-Seidel de GraphAnalyzer.pagerank, sobre o CSR de entrada.
+    cache=True grava o código compilado em disco e evita a compilação nas execuções seguintes.
+    """
+    n = inv_out.shape[0]
+    pr = np.full(n, 1.0 / n)
+    share = pr * inv_out
+    sink_pr_sum = 0.0
+    for i in range(n):
+        if is_sink[i]:
+            sink_pr_sum += pr[i]
+    teleport = (1.0 - d) / n
+
+    for _ in range(max_iter):
+        err = 0.0
+        for i in range(n):
+            incoming = 0.0
+            for k in range(in_indptr[i], in_indptr[i + 1]):
+                incoming += share[in_indices[k]]
+            new_pr = teleport + d * (incoming + sink_pr_sum / n)
+            if is_sink[i]:
+                sink_pr_sum += new_pr - pr[i]
+            else:
+                share[i] = new_pr * inv_out[i]
+            err += abs(new_pr - pr[i])
+            pr[i] = new_pr
+
+        if err < n * tol:
+            break
+        sink_pr_sum = 0.0
+        for i in range(n):
+            if is_sink[i]:
+                sink_pr_sum += pr[i]
+
+    return pr / pr.sum()
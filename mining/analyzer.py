@@ -1,8 +1,270 @@
+import heapq
 import math
+import importlib
+import os
 import random
-from typing import Dict, List, Tuple
+import signal
+import weakref
+from collections import Counter
+from array import array
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from graph_lib.abstract_graph import AbstractGraph
 
+class GraphView(NamedTuple):
+    """
+    Fotografia somente leitura de um grafo, compartilhada entre as métricas:
+    CSR de saída e de entrada, sequências de grau e rótulos, todos indexados pelo id do vértice.
+    converted guarda conversões preenchidas sob demanda (ex.: o networkx.DiGraph), que morrem com o snapshot.
+    """
+    n: int
+    indptr: array
+    indices: array
+    in_indptr: array
+    in_indices: array
+    out_deg: List[int]
+    in_deg: List[int]
+    labels: List[str]
+    converted: Dict[str, object]
+
+# Snapshots por grafo, reutilizados enquanto a versão do grafo não mudar;
+# a referência fraca deixa o grafo ser coletado normalmente
+_snapshot_cache = weakref.WeakKeyDictionary()
+
+def _snapshot(graph: AbstractGraph) -> GraphView:
+    cached = _snapshot_cache.get(graph)
+    if cached is not None and cached[0] == graph._version:
+        return cached[1]
+    view = _build_snapshot(graph)
+    _snapshot_cache[graph] = (graph._version, view)
+    return view
+
+def _transpose_csr(n: int, indptr, indices) -> Tuple[array, array]:
+    """
+    CSR de entrada obtido do CSR de saída por contagem (counting sort), sem consultar o grafo de novo.
+    Cada linha v lista os predecessores de v em ordem crescente.
+    """
+    counts = [0] * (n + 1)
+    for v in indices:
+        counts[v + 1] += 1
+    in_indptr = array('q', accumulate(counts))
+    in_indices = array('i', bytes(4 * len(indices)))
+    pos = in_indptr.tolist()
+    for u in range(n):
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            in_indices[pos[v]] = u
+            pos[v] += 1
+    return in_indptr, in_indices
+
+def _build_snapshot(graph: AbstractGraph) -> GraphView:
+    n = graph.getVertexCount()
+    # Uma única leitura da estrutura do grafo; o CSR transposto sai dos próprios arrays
+    indptr, indices, _ = graph.toCSR()
+    in_indptr, in_indices = _transpose_csr(n, indptr, indices)
+    out_deg = [indptr[u + 1] - indptr[u] for u in range(n)]
+    in_deg = [in_indptr[u + 1] - in_indptr[u] for u in range(n)]
+    labels = [graph.get_vertex_label(i) for i in range(n)]
+    return GraphView(n, indptr, indices, in_indptr, in_indices, out_deg, in_deg, labels, {})
+
+# Backends opcionais para grafos grandes; importados apenas quando pedidos
+BACKENDS = ("python", "networkx", "cugraph", "numba")
+
+def _load_backend(backend: str):
+    """
+    Importa sob demanda a biblioteca do backend externo.
+    Retorna None para "python" ou quando a biblioteca (ou o networkx, usado na conversão) não está instalada.
+    O numba opera direto sobre os arrays do snapshot e não precisa do networkx.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {backend}. Opções: {', '.join(BACKENDS)}")
+    if backend == "python":
+        return None
+    try:
+        if backend != "numba":
+            importlib.import_module("networkx")
+        return importlib.import_module(backend)
+    except ImportError:
+        print(f"Backend '{backend}' não instalado; usando a implementação Python.")
+        return None
+
+def _to_networkx(view: GraphView):
+    """
+    Converte o snapshot em networkx.DiGraph (vértices 0..n-1, inclusive os isolados).
+    O resultado fica em view.converted: as métricas chamadas em sequência sobre o mesmo grafo
+    (PageRank, betweenness, comunidades) reutilizam a mesma cópia; não altere o grafo retornado.
+    """
+    g = view.converted.get("networkx")
+    if g is not None:
+        return g
+    import networkx as nx
+    g = nx.DiGraph()
+    g.add_nodes_from(range(view.n))
+    indptr, indices = view.indptr, view.indices
+    g.add_edges_from((u, v) for u in range(view.n) for v in indices[indptr[u]:indptr[u + 1]])
+    view.converted["networkx"] = g
+    return g
+
+def _run_backend(lib, name: str, view: GraphView, **kwargs) -> Optional[Dict[str, float]]:
+    """
+    Executa lib.<name> sobre o grafo convertido e traduz o resultado {id: valor} para {rótulo: valor}.
+    Retorna None se o backend não oferecer o algoritmo ou falhar, para que o chamador use a versão Python.
+    """
+    func = getattr(lib, name, None)
+    if func is None:
+        print(f"Backend '{lib.__name__}' não oferece {name}; usando a implementação Python.")
+        return None
+    try:
+        values = func(_to_networkx(view), **kwargs)
+    except Exception as e:
+        print(f"Erro no backend '{lib.__name__}' ({name}): {e}; usando a implementação Python.")
+        return None
+    return {label: values.get(i, 0.0) for i, label in enumerate(view.labels)}
+
+def _pagerank_numba(view: GraphView, d: float, max_iter: int, tol: float) -> Dict[str, float]:
+    """PageRank compilado com numba sobre o CSR de entrada do snapshot (arrays vistos sem cópia)."""
+    import numpy as np
+    from mining._numba_kernels import pagerank_gauss_seidel
+    out_deg = np.asarray(view.out_deg, dtype=np.float64)
+    inv_out = np.divide(1.0, out_deg, out=np.zeros(view.n), where=out_deg > 0)
+    pr = pagerank_gauss_seidel(np.frombuffer(view.in_indptr, dtype=np.int64),
+                               np.frombuffer(view.in_indices, dtype=np.int32),
+                               inv_out, out_deg == 0, d, max_iter, tol)
+    return dict(zip(view.labels, pr.tolist()))
+
+# Fontes processadas juntas pela BFS bit-paralela do closeness (uma palavra de 64 bits)
+CLOSENESS_BATCH_SIZE = 64
+
+def _closeness_batch(indptr, indices, n: int, sources) -> Tuple[List[int], List[int]]:
+    """
+    BFS simultânea a partir de várias fontes sobre os arrays CSR: o bit j de cada
+    máscara representa sources[j], e cada aresta é percorrida uma vez por nível
+    para o lote inteiro. Retorna (soma das distâncias, nº de alcançados) por fonte.
+    """
+    k = len(sources)
+    visited = [0] * n
+    frontier = []
+    for j, s in enumerate(sources):
+        visited[s] = 1 << j
+        frontier.append((s, 1 << j))
+    dist_sums = [0] * k
+    reached = [0] * k
+    level = 0
+    while frontier:
+        level += 1
+        # OR das máscaras da fronteira em cada vizinho
+        next_bits = {}
+        for v, bits in frontier:
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                next_bits[w] = next_bits.get(w, 0) | bits
+        frontier = []
+        for w, bits in next_bits.items():
+            new = bits & ~visited[w]
+            if new:
+                visited[w] |= new
+                frontier.append((w, new))
+                # Cada bit novo é uma fonte que alcançou w neste nível
+                while new:
+                    low = new & -new
+                    j = low.bit_length() - 1
+                    dist_sums[j] += level
+                    reached[j] += 1
+                    new ^= low
+    return dist_sums, reached
+
+def _brandes_source(indptr, indices, in_indptr, s: int, cb: List[float], sigma: List[float], d: List[int],
+                    delta: List[float], preds: List[int], pred_count: List[int]):
+    """
+    Uma fonte do algoritmo de Brandes sobre os arrays CSR: BFS a partir de s
+    e acumulação das dependências em cb.
+    Os buffers são reaproveitados entre as fontes: chegam zerados (d com -1) e são
+    restaurados só nos vértices visitados. Os predecessores de w ocupam
+    preds[in_indptr[w]:in_indptr[w] + pred_count[w]] (no máximo o grau de entrada de w).
+    """
+    # 1. Single-source shortest-paths (BFS)
+    sigma[s] = 1.0
+    d[s] = 0
+    # S guarda a ordem de visita e serve também de fila (head avança sobre ela)
+    S = [s]
+    head = 0
+    while head < len(S):
+        v = S[head]
+        head += 1
+        dv = d[v] + 1
+        for w in indices[indptr[v]:indptr[v + 1]]:
+            # Path discovery
+            if d[w] < 0:
+                S.append(w)
+                d[w] = dv
+            # Path counting
+            if d[w] == dv:
+                sigma[w] += sigma[v]
+                preds[in_indptr[w] + pred_count[w]] = v
+                pred_count[w] += 1
+    
+    # 2. Accumulation
+    while S:
+        w = S.pop()
+        start = in_indptr[w]
+        for v in preds[start:start + pred_count[w]]:
+            if sigma[w] > 0: # Evitar div por zero
+                delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
+        if w != s:
+            cb[w] += delta[w]
+        # w não é predecessor de nenhum vértice ainda na pilha: pode ser restaurado
+        sigma[w] = 0.0
+        d[w] = -1
+        delta[w] = 0.0
+        pred_count[w] = 0
+
+def _brandes_sources(indptr, indices, in_indptr, n: int, sources) -> List[float]:
+    """Betweenness acumulada (não normalizada) sobre um conjunto de fontes."""
+    cb = [0.0] * n
+    # Buffers alocados uma vez para todas as fontes
+    sigma = [0.0] * n
+    d = [-1] * n
+    delta = [0.0] * n
+    # Arena de predecessores com o layout do CSR transposto
+    preds = [0] * len(indices)
+    pred_count = [0] * n
+    for s in sources:
+        _brandes_source(indptr, indices, in_indptr, s, cb, sigma, d, delta, preds, pred_count)
+    return cb
+
+# Abaixo deste número de vértices, iniciar processos custa mais do que o cálculo sequencial
+PARALLEL_MIN_VERTICES = 2000
+
+# CSR recebido uma vez por processo auxiliar (initializer), em vez de a cada bloco de fontes
+_worker_csr = None
+
+def _init_brandes_worker(indptr, indices, in_indptr, n: int):
+    # O processo herda o handler de Ctrl+C do menu (que salva o minerador); só o processo
+    # principal deve tratar a interrupção e encerrar o pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    global _worker_csr
+    _worker_csr = (indptr, indices, in_indptr, n)
+
+def _brandes_worker(sources) -> List[float]:
+    indptr, indices, in_indptr, n = _worker_csr
+    return _brandes_sources(indptr, indices, in_indptr, n, sources)
+
+def _brandes_parallel(view: GraphView, workers: int) -> List[float]:
+    """
+    Distribui as fontes do Brandes entre processos (cada fonte é independente)
+    e soma as contribuições parciais.
+    """
+    # Importado só aqui: concurrent.futures.process arrasta o multiprocessing para todo import do módulo
+    from concurrent.futures import ProcessPoolExecutor
+    n = view.n
+    # Fontes intercaladas em vários blocos por processo, para equilibrar a carga
+    blocks = workers * 4
+    chunks = [range(k, n, blocks) for k in range(min(blocks, n))]
+    cb = [0.0] * n
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_brandes_worker,
+                             initargs=(view.indptr, view.indices, view.in_indptr, n)) as pool:
+        for partial in pool.map(_brandes_worker, chunks):
+            cb = [a + b for a, b in zip(cb, partial)]
+    return cb
+
 class GraphAnalyzer:
     """
     Implementação dos algoritmos e métricas da Etapa 3.
@@ -13,11 +275,8 @@ class GraphAnalyzer:
     @staticmethod
     def degree_centrality(graph: AbstractGraph) -> Dict[str, Tuple[int, int]]:
         """Retorna {label: (in_degree, out_degree)}"""
-        metrics = {}
-        for i in range(graph.getVertexCount()):
-            label = graph.get_vertex_label(i)
-            metrics[label] = (graph.getVertexInDegree(i), graph.getVertexOutDegree(i))
-        return metrics
+        view = _snapshot(graph)
+        return {label: (in_d, out_d) for label, in_d, out_d in zip(view.labels, view.in_deg, view.out_deg)}
 
     @staticmethod
     def closeness_centrality(graph: AbstractGraph) -> Dict[str, float]:
@@ -26,112 +285,116 @@ class GraphAnalyzer:
         C(u) = (N - 1) / Sum(dist(u, v))
         Para grafos desconexos, usa a fórmula de Wasserman e Faust.
         """
-        n = graph.getVertexCount()
+        view = _snapshot(graph)
+        n = view.n
         closeness = {}
         
-        for s in range(n):
-            # BFS para calcular distâncias curtas a partir de s
-            distances = {s: 0}
-            queue = [s]
-            while queue:
-                u = queue.pop(0)
-                for v in graph.getNeighbors(u):
-                    if v not in distances:
-                        distances[v] = distances[u] + 1
-                        queue.append(v)
-            
-            total_dist = sum(distances.values())
-            reachable = len(distances) - 1 # remove self
-            
-            if total_dist > 0 and reachable > 0:
-                # Fórmula ajustada para grafos desconexos
-                val = (reachable / (n - 1)) * (reachable / total_dist)
-            else:
-                val = 0.0
+        # BFS bit-paralela: cada lote de fontes percorre o grafo de uma só vez
+        for start in range(0, n, CLOSENESS_BATCH_SIZE):
+            sources = range(start, min(start + CLOSENESS_BATCH_SIZE, n))
+            dist_sums, reached = _closeness_batch(view.indptr, view.indices, n, sources)
             
-            closeness[graph.get_vertex_label(s)] = val
+            for s, total_dist, reachable in zip(sources, dist_sums, reached):
+                if total_dist > 0 and reachable > 0:
+                    # Fórmula ajustada para grafos desconexos
+                    val = (reachable / (n - 1)) * (reachable / total_dist)
+                else:
+                    val = 0.0
+                
+                closeness[view.labels[s]] = val
             
         return closeness
 
     @staticmethod
-    def betweenness_centrality(graph: AbstractGraph) -> Dict[str, float]:
+    def betweenness_centrality(graph: AbstractGraph, backend: str = "python",
+                               workers: Optional[int] = None) -> Dict[str, float]:
         """
         Implementação simplificada do algoritmo de Brandes para Betweenness.
+        As fontes são divididas entre `workers` processos (padrão: os.cpu_count() a partir de
+        PARALLEL_MIN_VERTICES vértices; workers=1 força o cálculo sequencial).
+        backend="networkx" ou "cugraph" delega o cálculo à biblioteca, se instalada.
         """
-        n = graph.getVertexCount()
-        cb = {v: 0.0 for v in range(n)}
-        
-        for s in range(n):
-            # 1. Single-source shortest-paths (BFS)
-            S = []
-            P = {w: [] for w in range(n)}
-            sigma = {w: 0.0 for w in range(n)}; sigma[s] = 1.0
-            d = {w: -1 for w in range(n)}; d[s] = 0
-            Q = [s]
-            
-            while Q:
-                v = Q.pop(0)
-                S.append(v)
-                for w in graph.getNeighbors(v):
-                    # Path discovery
-                    if d[w] < 0:
-                        Q.append(w)
-                        d[w] = d[v] + 1
-                    # Path counting
-                    if d[w] == d[v] + 1:
-                        sigma[w] += sigma[v]
-                        P[w].append(v)
-            
-            # 2. Accumulation
-            delta = {v: 0.0 for v in range(n)}
-            while S:
-                w = S.pop()
-                for v in P[w]:
-                    if sigma[w] > 0: # Evitar div por zero
-                        delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
-                if w != s:
-                    cb[w] += delta[w]
+        view = _snapshot(graph)
+        lib = _load_backend(backend)
+        if lib is not None:
+            result = _run_backend(lib, "betweenness_centrality", view, normalized=True)
+            if result is not None:
+                return result
+        n = view.n
+        if workers is None:
+            workers = (os.cpu_count() or 1) if n >= PARALLEL_MIN_VERTICES else 1
+        if workers > 1 and n > 1:
+            cb = _brandes_parallel(view, workers)
+        else:
+            cb = _brandes_sources(view.indptr, view.indices, view.in_indptr, n, range(n))
                     
         # Normalização para grafo direcionado: 1 / ((N-1)(N-2))
         norm = (n - 1) * (n - 2)
         result = {}
         for v in range(n):
             val = cb[v] / norm if norm > 0 else 0
-            result[graph.get_vertex_label(v)] = val
+            result[view.labels[v]] = val
         return result
 
     @staticmethod
-    def pagerank(graph: AbstractGraph, d: float = 0.85, iter: int = 100) -> Dict[str, float]:
+    def pagerank(graph: AbstractGraph, d: float = 0.85, iter: int = 100, tol: float = 1e-6,
+                 backend: str = "python") -> Dict[str, float]:
         """
-        Algoritmo PageRank (Power Iteration).
+        Algoritmo PageRank (iteração de Gauss-Seidel).
+        Cada vértice é atualizado no lugar, lendo os valores já atualizados da
+        mesma varredura; converge para o mesmo vetor em cerca de metade das iterações.
+        Para antes de `iter` varreduras quando a variação L1 fica abaixo de n * tol.
+        backend="networkx" ou "cugraph" delega o cálculo à biblioteca, se instalada;
+        backend="numba" compila a mesma iteração em código de máquina.
         """
-        n = graph.getVertexCount()
+        view = _snapshot(graph)
+        lib = _load_backend(backend)
+        if lib is not None and backend == "numba" and view.n > 0:
+            return _pagerank_numba(view, d, iter, tol)
+        if lib is not None and view.n > 0:
+            result = _run_backend(lib, "pagerank", view, alpha=d, max_iter=iter, tol=tol)
+            if result is not None:
+                return result
+        n = view.n
         if n == 0: return {}
         
         pr = [1.0 / n] * n
         
         # Identificar nós sem saída (sinks) para distribuir seu rank
-        out_degrees = [graph.getVertexOutDegree(i) for i in range(n)]
+        out_degrees = view.out_deg
+        in_indptr, in_indices = view.in_indptr, view.in_indices
+        # Contribuição de cada vértice para seus sucessores: pr[u] / out_degree(u)
+        inv_out = [1.0 / k if k else 0.0 for k in out_degrees]
+        share = [p * w for p, w in zip(pr, inv_out)]
+        # Máscara e lista dos sinks calculadas uma vez, fora das iterações
+        is_sink = bytearray(k == 0 for k in out_degrees)
+        sinks = [i for i in range(n) if is_sink[i]]
+        sink_pr_sum = sum(pr[i] for i in sinks)
+        teleport = (1 - d) / n
         
         for _ in range(iter):
-            new_pr = [0.0] * n
-            sink_pr_sum = sum(pr[i] for i in range(n) if out_degrees[i] == 0)
-            
+            err = 0.0
             for i in range(n):
-                # Contribuição dos nós que apontam para i
-                incoming = 0.0
-                # Maneira ineficiente (O(V+E)), mas funciona com a API atual
-                # Idealmente teríamos getPredecessors(i)
-                for candidate in range(n):
-                    if graph.hasEdge(candidate, i):
-                        if out_degrees[candidate] > 0:
-                            incoming += pr[candidate] / out_degrees[candidate]
-                
-                new_pr[i] = (1 - d) / n + d * (incoming + sink_pr_sum / n)
+                # Soma sobre os predecessores de i (linha i do CSR transposto)
+                incoming = sum([share[c] for c in in_indices[in_indptr[i]:in_indptr[i + 1]]])
+                new_pr = teleport + d * (incoming + sink_pr_sum / n)
+                if is_sink[i]:
+                    # Soma dos sinks mantida incrementalmente durante a varredura
+                    sink_pr_sum += new_pr - pr[i]
+                else:
+                    share[i] = new_pr * inv_out[i]
+                err += abs(new_pr - pr[i])
+                pr[i] = new_pr
             
-            pr = new_pr
+            # Critério de convergência (norma L1), o mesmo do NetworkX
+            if err < n * tol:
+                break
+            # Recalculada só sobre os sinks, evitando acúmulo de erro de arredondamento
+            sink_pr_sum = sum(pr[i] for i in sinks)
 
-        return {graph.get_vertex_label(i): pr[i] for i in range(n)}
+        # A atualização no lugar não preserva a soma exatamente; renormaliza para somar 1
+        total = sum(pr)
+        return {label: p / total for label, p in zip(view.labels, pr)}
 
     # --- Métricas de Estrutura e Coesão ---
 
@@ -151,25 +414,23 @@ class GraphAnalyzer:
         Simplificação comum: tratar vizinhança como não direcionada ou considerar apenas 'sucessores'.
         Aqui usaremos a definição padrão Watts-Strogatz adaptada: vizinhos totais (in + out).
         """
-        n = graph.getVertexCount()
+        view = _snapshot(graph)
+        n = view.n
         total_cc = 0.0
+        indptr, indices, in_indptr, in_indices = view.indptr, view.indices, view.in_indptr, view.in_indices
+        # Vizinhança total (in + out) de cada vértice, como conjunto
+        # (predecessores incluídos para visão completa de vizinhança)
+        neighborhoods = [set(indices[indptr[i]:indptr[i + 1]]).union(in_indices[in_indptr[i]:in_indptr[i + 1]])
+                         for i in range(n)]
         
         for i in range(n):
-            neighbors = set(graph.getNeighbors(i))
-            # Adicionar predecessores para visão completa de vizinhança (opcional, mas recomendado)
-            for cand in range(n):
-                if graph.hasEdge(cand, i): neighbors.add(cand)
-            
+            neighbors = neighborhoods[i]
             k = len(neighbors)
             if k < 2:
                 continue
-                
-            links = 0
-            neighbors_list = list(neighbors)
-            for idx, u in enumerate(neighbors_list):
-                for v in neighbors_list[idx+1:]:
-                    if graph.hasEdge(u, v) or graph.hasEdge(v, u):
-                        links += 1
+            
+            # Cada par conectado {u, v} aparece nas interseções de u e de v
+            links = sum(len(neighborhoods[u] & neighbors) for u in neighbors) // 2
             
             # Possíveis conexões entre k vizinhos (não direcionado para o cluster): k*(k-1)/2
             total_cc += links / (k * (k - 1) / 2)
@@ -182,23 +443,25 @@ class GraphAnalyzer:
         Assortatividade por Grau (Correlação de Pearson entre graus de nós conectados).
         Consideraremos (out_degree do source, in_degree do target).
         """
-        edges = []
-        for u in range(graph.getVertexCount()):
-            for v in graph.getNeighbors(u):
-                edges.append((graph.getVertexOutDegree(u), graph.getVertexInDegree(v)))
+        # Sequências de grau extraídas uma única vez, em vez de duas consultas por aresta
+        view = _snapshot(graph)
+        out_deg, in_deg = view.out_deg, view.in_deg
+        indptr, indices = view.indptr, view.indices
         
-        if not edges: return 0.0
+        # Somas da correlação de Pearson acumuladas numa única passada pelas arestas
+        n = sum_x = sum_y = sum_x2 = sum_y2 = sum_xy = 0
+        for u in range(view.n):
+            x = out_deg[u]
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                y = in_deg[v]
+                n += 1
+                sum_x += x
+                sum_y += y
+                sum_x2 += x * x
+                sum_y2 += y * y
+                sum_xy += x * y
         
-        x = [e[0] for e in edges]
-        y = [e[1] for e in edges]
-        
-        # Cálculo da correlação de Pearson
-        n = len(edges)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_x2 = sum(i*i for i in x)
-        sum_y2 = sum(i*i for i in y)
-        sum_xy = sum(i*j for i, j in zip(x, y))
+        if n == 0: return 0.0
         
         numerator = n * sum_xy - sum_x * sum_y
         denominator = math.sqrt((n * sum_x2 - sum_x**2) * (n * sum_y2 - sum_y**2))
@@ -208,15 +471,31 @@ class GraphAnalyzer:
     # --- Métricas de Comunidade ---
 
     @staticmethod
-    def detect_communities_label_propagation(graph: AbstractGraph) -> Dict[str, int]:
+    def detect_communities_label_propagation(graph: AbstractGraph, backend: str = "python") -> Dict[str, int]:
         """
         Algoritmo de Propagação de Rótulos (Label Propagation) para detecção de comunidades.
         Retorna {label_usuario: id_comunidade}
+        backend="networkx" usa asyn_lpa_communities (vizinhança não direcionada, como aqui);
+        o cugraph não oferece propagação de rótulos e cai na versão Python.
         """
-        n = graph.getVertexCount()
+        view = _snapshot(graph)
+        lib = _load_backend(backend)
+        if lib is not None and backend == "networkx":
+            # Cada comunidade recebe o menor id entre seus membros;
+            # a visão não direcionada evita copiar o grafo
+            communities = lib.community.asyn_lpa_communities(_to_networkx(view).to_undirected(as_view=True))
+            membership = {v: min(members) for members in communities for v in members}
+            return {label: membership[i] for i, label in enumerate(view.labels)}
+        elif lib is not None:
+            print(f"Backend '{backend}' não oferece propagação de rótulos; usando a implementação Python.")
+        n = view.n
         # Inicialmente cada nó é sua própria comunidade
         labels = list(range(n))
         indices = list(range(n))
+        # Vizinhança combinada (sucessores + predecessores, para coesão bidirecional), montada uma vez
+        neighborhoods = [view.indices[view.indptr[i]:view.indptr[i + 1]].tolist()
+                         + view.in_indices[view.in_indptr[i]:view.in_indptr[i + 1]].tolist()
+                         for i in range(n)]
         
         changed = True
         iter_count = 0
@@ -225,19 +504,11 @@ class GraphAnalyzer:
             random.shuffle(indices) # Assíncrono aleatório
             
             for i in indices:
-                neighbors = graph.getNeighbors(i)
-                # Incluir predecessores também para coesão bidirecional
-                for cand in range(n):
-                    if graph.hasEdge(cand, i): neighbors.append(cand)
-                
+                neighbors = neighborhoods[i]
                 if not neighbors: continue
                 
                 # Encontrar label mais frequente na vizinhança
-                neighbor_labels = [labels[v] for v in neighbors]
-                freq = {}
-                for l in neighbor_labels:
-                    freq[l] = freq.get(l, 0) + 1
-                
+                freq = Counter(map(labels.__getitem__, neighbors))
                 max_freq = max(freq.values())
                 candidates = [l for l, f in freq.items() if f == max_freq]
                 new_label = random.choice(candidates)
@@ -247,7 +518,7 @@ class GraphAnalyzer:
                     changed = True
             iter_count += 1
             
-        return {graph.get_vertex_label(i): labels[i] for i in range(n)}
+        return dict(zip(view.labels, labels))
 
     @staticmethod
     def analyze_bridging_ties(graph: AbstractGraph, communities: Dict[str, int]):
@@ -255,23 +526,19 @@ class GraphAnalyzer:
         Identifica usuários que conectam comunidades diferentes (Bridging Ties).
         Usuários com arestas conectando nós de labels diferentes.
         """
+        view = _snapshot(graph)
+        indptr, indices = view.indptr, view.indices
+        # Comunidade de cada vértice indexada pelo id (None se o rótulo não estiver em communities)
+        comm = [communities.get(label) for label in view.labels]
         bridges = []
-        n = graph.getVertexCount()
         
-        for u in range(n):
-            u_label = graph.get_vertex_label(u)
-            if u_label not in communities: continue
-            u_comm = communities[u_label]
+        for u, u_comm in enumerate(comm):
+            if u_comm is None: continue
             
-            connections_outside = 0
-            for v in graph.getNeighbors(u):
-                v_label = graph.get_vertex_label(v)
-                if communities.get(v_label) != u_comm:
-                    connections_outside += 1
+            connections_outside = sum(1 for v in indices[indptr[u]:indptr[u + 1]] if comm[v] != u_comm)
             
             if connections_outside > 0:
-                bridges.append((u_label, connections_outside))
+                bridges.append((view.labels[u], connections_outside))
         
         # Retorna os top 5 pontes
-        bridges.sort(key=lambda x: x[1], reverse=True)
-        return bridges[:5]
\ No newline at end of file
+        return heapq.nlargest(5, bridges, key=lambda x: x[1])
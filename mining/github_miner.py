@@ -1,11 +1,19 @@
-import requests
 import time
+import heapq
 import json
 import os
+import sys
+import threading
+import zipfile
+from array import array
+from itertools import accumulate, compress, islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from urllib.parse import urlencode
+from typing import Dict, Iterable, Iterator, List, Tuple
 from graph_lib.adjacency_list import AdjacencyListGraph
-from graph_lib.abstract_graph import AbstractGraph
+from graph_lib.abstract_graph import AbstractGraph, _npy_array, _npy_bytes
 
 # PESOS
 WEIGHT_COMMENT = 2.0
@@ -13,126 +21,692 @@ WEIGHT_CLOSE   = 3.0
 WEIGHT_REVIEW  = 4.0
 WEIGHT_MERGE   = 5.0
 
+# Requisições simultâneas durante a mineração (limite gentil para a API do GitHub)
+MAX_CONCURRENT_REQUESTS = 10
+
+# Paginação da API REST
+PER_PAGE  = 100
+MAX_PAGES = 3  # Número máximo de páginas a buscar
+
+# Conexões mantidas abertas com a API: cada thread de mine_data pode buscar MAX_PAGES páginas em paralelo
+HTTP_POOL_MAXSIZE = MAX_CONCURRENT_REQUESTS * MAX_PAGES
+
+# Tempo máximo (s) de cada requisição e novas tentativas automáticas em falhas transitórias do servidor
+REQUEST_TIMEOUT = 30
+HTTP_MAX_RETRIES = 5
+
+# Abaixo desse número de requisições restantes, aguarda o reset da janela de rate limit.
+# O limite é proporcional ao tamanho da janela (X-RateLimit-Limit): 20 das 5000/h com token,
+# mas nenhuma reserva nas 60/h sem token (só espera quando elas acabam)
+RATE_LIMIT_MIN_REMAINING = 20
+RATE_LIMIT_MIN_FRACTION = 0.01
+# Novas tentativas após respostas de rate limit (403/429), e teto (s) da espera exponencial do limite secundário
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_MAX_BACKOFF = 60
+
+# Cache persistente de ETags (GET condicional) entre minerações, um arquivo por repositório.
+# Só as entradas usadas na última mineração são regravadas, até ETAG_CACHE_MAX_ENTRIES
+ETAG_CACHE_FILE = "github_etag_cache_{owner}_{repo}.json"
+ETAG_CACHE_MAX_ENTRIES = 5000
+
+# API GraphQL (v4): uma consulta paginada traz os itens com todas as interações
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+GRAPHQL_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id
+        number
+        createdAt
+        state
+        author { login }
+        comments(first: 100) { pageInfo { hasNextPage endCursor } nodes { author { login } } }
+        timelineItems(itemTypes: [CLOSED_EVENT], last: 1) { nodes { ... on ClosedEvent { actor { login } } } }
+      }
+    }
+  }
+}
+"""
+
+GRAPHQL_PULLS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id
+        number
+        createdAt
+        author { login }
+        mergedBy { login }
+        comments(first: 100) { pageInfo { hasNextPage endCursor } nodes { author { login } } }
+        reviews(first: 100) { pageInfo { hasNextPage endCursor } nodes { author { login } } }
+      }
+    }
+  }
+}
+"""
+
+# Páginas seguintes de uma conexão aninhada (comentários ou reviews) de uma issue ou PR
+GRAPHQL_NESTED_QUERY = """
+query($id: ID!, $cursor: String) {
+  node(id: $id) {
+    ... on %(type)s {
+      %(connection)s(first: 100, after: $cursor) { pageInfo { hasNextPage endCursor } nodes { author { login } } }
+    }
+  }
+}
+"""
+
+class _GraphQLError(Exception):
+    """Falha em uma página da consulta GraphQL; a mineração cai para a API REST."""
+
+def _author_logins(nodes) -> List[str]:
+    """Logins dos autores de nós GraphQL, ignorando autores removidos (null)."""
+    return [node["author"]["login"] for node in nodes if node and node.get("author")]
+
+# Tipos de interação, armazenados como código de 1 byte no InteractionLog
+INTERACTION_TYPES = ("comment", "close", "review", "merge")
+TYPE_CODES = {type_: code for code, type_ in enumerate(INTERACTION_TYPES)}
+
+# Grafos construídos por build_graphs: nome -> tipos de interação (None = todos)
+GRAPH_GROUPS = {
+    "comments": ["comment"],
+    "closed": ["close"],
+    "reviews": ["review", "merge"],
+    "integrado": None,
+}
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Importa o orjson na primeira serialização (uma única tentativa); None se não estiver instalado."""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serializa em JSON (UTF-8) com orjson, se instalado, ou com o json da biblioteca padrão."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data: bytes):
+    orjson = _orjson()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+class InteractionLog:
+    """
+    Sequência de interações (u, v, tipo, peso) armazenada em colunas array.array,
+    em vez de uma tupla Python por interação (~13 bytes contra ~200 por registro).
+    Se comporta como a lista de tuplas anterior: append, len, iteração e fatiamento.
+    """
+    __slots__ = ("src", "dst", "types", "weights")
+
+    def __init__(self, interactions: Iterable[Tuple[int, int, str, float]] = ()):
+        self.src = array('i')
+        self.dst = array('i')
+        self.types = array('b')
+        # Pesos por interação são as constantes WEIGHT_* (inteiros pequenos, exatos em float32);
+        # a soma por aresta continua em float64
+        self.weights = array('f')
+        for interaction in interactions:
+            self.append(interaction)
+
+    def append(self, interaction: Tuple[int, int, str, float]):
+        u, v, type_, weight = interaction
+        self.src.append(u)
+        self.dst.append(v)
+        self.types.append(TYPE_CODES[type_])
+        self.weights.append(weight)
+
+    def extend_to(self, dst: int, sources: List[int], type_: str, weight: float):
+        """
+        Acrescenta as interações (u, dst, tipo, peso) de cada u em sources, em ordem.
+        Destino, tipo e peso são resolvidos uma vez para o grupo, não a cada interação.
+        """
+        count = len(sources)
+        self.src.extend(sources)
+        self.dst.extend(array('i', [dst]) * count)
+        self.types.extend(array('b', [TYPE_CODES[type_]]) * count)
+        self.weights.extend(array('f', [weight]) * count)
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str, float]]:
+        for u, v, code, weight in zip(self.src, self.dst, self.types, self.weights):
+            yield u, v, INTERACTION_TYPES[code], weight
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [(self.src[i], self.dst[i], INTERACTION_TYPES[self.types[i]], self.weights[i])
+                    for i in range(*idx.indices(len(self)))]
+        return self.src[idx], self.dst[idx], INTERACTION_TYPES[self.types[idx]], self.weights[idx]
+
+    def to_list(self) -> List[List]:
+        """Formato serializável (lista de [u, v, tipo, peso]), o mesmo dos JSONs salvos."""
+        return [list(interaction) for interaction in self]
+
+    @classmethod
+    def from_columns(cls, src: array, dst: array, types: array, weights: array) -> "InteractionLog":
+        """Monta o log direto das colunas (ex.: lidas de um .npz), sem passar por tuplas."""
+        if not len(src) == len(dst) == len(types) == len(weights):
+            raise ValueError("Colunas de interações com tamanhos diferentes.")
+        log = cls()
+        log.src.extend(src)
+        log.dst.extend(dst)
+        log.types.extend(types)
+        log.weights.extend(weights)
+        return log
+
+def _load_saved_data_streaming(f) -> dict:
+    """
+    Lê um JSON salvo por save_data_to_json com ijson (opcional), sem materializar a lista de interações:
+    cada [u, v, tipo, peso] vai direto para o InteractionLog. Retorna o mesmo dicionário de json.load,
+    com raw_interactions já como InteractionLog. Levanta ImportError se o ijson não estiver instalado.
+    """
+    import ijson
+    data = {}
+    user_map = {}
+    log = InteractionLog()
+    events = ijson.parse(f, use_float=True)
+    for prefix, event, value in events:
+        if prefix == "raw_interactions.item" and event == "start_array":
+            log.append(tuple(next(events)[2] for _ in range(4)))
+            next(events)  # end_array
+        elif prefix == "user_map" and event == "map_key":
+            user_map[value] = next(events)[2]
+        elif event in ("string", "number") and "." not in prefix:
+            data[prefix] = value
+    data["user_map"] = user_map
+    data["raw_interactions"] = log
+    return data
+
+def _load_saved_data_npz(filename: str) -> dict:
+    """
+    Lê um arquivo salvo por save_data_to_npz e retorna o mesmo dicionário de json.load,
+    com raw_interactions já como InteractionLog.
+    """
+    with zipfile.ZipFile(filename) as zf:
+        data = _json_loads(zf.read("metadata.json"))
+        if data.get("interaction_types", list(INTERACTION_TYPES)) != list(INTERACTION_TYPES):
+            raise ValueError(f"Tipos de interação desconhecidos: {data['interaction_types']}")
+        columns = [_npy_array(zf.read(f"{name}.npy")) for name in ("src", "dst", "types", "weights")]
+    data["user_map"] = {login: uid for uid, login in enumerate(data.pop("user_logins", []))}
+    data["raw_interactions"] = InteractionLog.from_columns(*columns)
+    return data
+
 class GitHubMiner:
     def __init__(self, repo_owner: str, repo_name: str, token: str = None):
         self.repo_owner = repo_owner
         self.repo_name  = repo_name
+        self.token      = token
         self.headers    = {"Authorization": f"token {token}"} if token else {}
         self.base_url   = f"https://api.github.com/repos/{repo_owner}/{repo_name}"
         
         self.user_map: Dict[str, int] = {}
         self.next_id = 0
+        # Mapa inverso (id -> login), mantido junto com user_map para rotular os grafos
+        self.user_logins: List[str] = []
         
         # Types: 'comment', 'close', 'review', 'merge'
-        self.raw_interactions: List[Tuple[int, int, str, float]] = []
+        self.raw_interactions = InteractionLog()
+
+        # Cache de GET condicional: chave da requisição -> (ETag, resposta já decodificada)
+        self._etag_cache: Dict[str, Tuple[str, object]] = {}
+        # Chaves consultadas nesta mineração, na ordem de uso (dict como conjunto ordenado);
+        # só elas são persistidas, o que descarta recursos que deixaram de ser minerados
+        self._etag_used: Dict[str, None] = {}
+
+        # Sessão HTTP persistente, criada na primeira requisição (ver _get_session)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Pausa de rate limit compartilhada pelas threads: nenhuma requisição sai antes desse instante
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_until = 0.0
+
+    def _get_session(self):
+        """
+        Sessão HTTP compartilhada: as conexões TCP/TLS com a API são reaproveitadas (keep-alive)
+        em vez de um handshake por requisição; o pool comporta todas as threads de mine_data e _request.
+        O requests só é importado aqui (~0,3 s), então carregar e analisar dados salvos não paga esse custo.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from urllib3.util import Retry
+                    session = requests.Session()
+                    session.headers.update(self.headers)
+                    # 502/503/504 são repetidos com espera exponencial (0,5 s, 1 s, 2 s...);
+                    # a consulta GraphQL é só leitura, então o POST também pode ser repetido
+                    retries = Retry(total=HTTP_MAX_RETRIES, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                                    allowed_methods=frozenset({"GET", "POST"}), raise_on_status=False)
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE,
+                                                            max_retries=retries)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def close(self):
+        """
+        Fecha a sessão HTTP e libera as conexões do pool.
+        O miner continua utilizável: uma nova sessão é criada na próxima requisição.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _get_user_id(self, login: str) -> int:
-        if login not in self.user_map:
-            self.user_map[login] = self.next_id
+        # Uma única consulta ao dicionário no caso comum (usuário já visto)
+        uid = self.user_map.get(login)
+        if uid is None:
+            # Logins novos são internados: user_map, user_logins e os rótulos dos grafos
+            # compartilham o mesmo objeto str
+            login = sys.intern(login)
+            uid = self.user_map[login] = self.next_id
+            self.user_logins.append(login)
             self.next_id += 1
-        return self.user_map[login]
+        return uid
 
-    def _request(self, url: str, params: dict = None):
-        
-        data = []
-        page = 1
-        max_pages = 3  # Número máximo de páginas a buscar 
+    def _pause_requests(self, wait: float, message: str):
+        """
+        Adia todas as requisições (de todas as threads) por wait segundos. Só a thread que
+        estende o prazo mostra a mensagem; as demais apenas esperam o mesmo prazo em _send.
+        """
+        deadline = time.time() + wait
+        with self._rate_limit_lock:
+            if deadline <= self._rate_limit_until:
+                return
+            self._rate_limit_until = deadline
+        print(message)
+
+    def _respect_rate_limit(self, resp):
+        """
+        Pausa até o reset da janela quando X-RateLimit-Remaining está quase no fim,
+        em vez de esperar um intervalo fixo entre todas as requisições.
+        """
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        limit = resp.headers.get("X-RateLimit-Limit")
+        threshold = RATE_LIMIT_MIN_REMAINING
+        if limit is not None:
+            threshold = min(threshold, int(limit) * RATE_LIMIT_MIN_FRACTION)
+        if int(remaining) > threshold:
+            return
+        reset = int(resp.headers.get("X-RateLimit-Reset", 0))
+        wait = max(0.0, reset - time.time()) + 1
+        self._pause_requests(wait, f"Limite de requisições quase esgotado ({remaining} restantes); aguardando {wait:.0f}s...")
+
+    def _rate_limit_wait(self, resp, attempt: int):
+        """
+        Segundos a aguardar antes de repetir uma resposta 403/429 de rate limit, ou None se não for o caso
+        (ex.: 403 de permissão). Segue a orientação do GitHub: Retry-After quando presente; com o limite
+        primário esgotado, até X-RateLimit-Reset; no limite secundário, espera exponencial.
+        """
+        if resp.status_code not in (403, 429):
+            return None
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(resp.headers.get("X-RateLimit-Reset", 0))
+            return max(1.0, reset - time.time() + 1)
+        if resp.status_code == 429 or "rate limit" in resp.text.lower():
+            return float(min(RATE_LIMIT_MAX_BACKOFF, 2 ** attempt))
+        return None
 
+    def _send(self, method: str, url: str, **kwargs):
+        """
+        Envia a requisição pela sessão compartilhada. Respostas de rate limit são repetidas
+        (até RATE_LIMIT_MAX_RETRIES vezes) após a espera indicada, em vez de descartar o recurso.
+        """
+        session = self._get_session()
+        attempt = 0
+        while True:
+            # Espera a pausa compartilhada, se alguma thread tiver encontrado o limite
+            pause = self._rate_limit_until - time.time()
+            if pause > 0:
+                time.sleep(pause)
+            resp = session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            print(f"{method} {resp.url} -> status {resp.status_code}")
+            wait = self._rate_limit_wait(resp, attempt)
+            if wait is None:
+                break
+            if attempt >= RATE_LIMIT_MAX_RETRIES:
+                # Tentativas esgotadas: devolve a resposta de erro sem esperar de novo
+                return resp
+            self._pause_requests(wait, f"Rate limit atingido (HTTP {resp.status_code}); nova tentativa em {wait:.0f}s...")
+            attempt += 1
+        self._respect_rate_limit(resp)
+        return resp
+
+    def _get_page(self, url: str, params: dict, page: int):
+        """
+        Busca uma página de um endpoint paginado. Retorna a lista da página ou None em caso de erro.
+        """
+        final_params = dict(params) if params else {}
+        final_params["per_page"] = PER_PAGE
+        final_params["page"]     = page
+        return self._get_json(url, final_params)
+
+    def _get_json(self, url: str, params: dict = None, fields: Tuple[str, ...] = None):
+        """
+        GET de um recurso da API REST. Retorna o JSON decodificado ou None em caso de erro.
+        Com fields, o objeto retornado (e guardado no cache) mantém só essas chaves.
+        """
+        # GET condicional: com o ETag da última resposta, o GitHub devolve 304 sem
+        # corpo e sem consumir o rate limit quando o recurso não mudou
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        self._etag_used[cache_key] = None
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        try:
+            resp = self._send("GET", url, headers=headers, params=params)
+
+            if resp.status_code == 304 and cached:
+                return cached[1]
+            if resp.status_code == 403:
+                print("Rate Limit atingido ou erro de permissão.")
+                print(resp.text)
+                return None
+            if resp.status_code != 200:
+                print(f"Erro HTTP {resp.status_code} ao acessar {url}")
+                print(resp.text)
+                return None
+
+            # Decodificado direto dos bytes (com orjson, se instalado), sem o passo de texto de resp.json()
+            data = _json_loads(resp.content)
+            if fields is not None and isinstance(data, dict):
+                data = {field: data.get(field) for field in fields}
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, data)
+            return data
+        except Exception as e:
+            print(f"Erro de conexão: {e}")
+            return None
+
+    def _request(self, url: str, params: dict = None):
+        """
+        Busca até MAX_PAGES páginas de um endpoint. A primeira página é buscada sozinha;
+        se vier cheia, as demais são buscadas em paralelo e concatenadas em ordem,
+        parando na primeira página vazia ou com erro.
+        """
         print(f"Requisitando: {url}...")
-        while page <= max_pages:
-            final_params = dict(params) if params else {}
-            final_params["per_page"] = 100
-            final_params["page"]     = page
-
-            try:
-                resp = requests.get(url, headers=self.headers, params=final_params)
-                print(f"GET {resp.url} -> status {resp.status_code}")
-                
-                if resp.status_code == 403:
-                    print("Rate Limit atingido ou erro de permissão.")
-                    print(resp.text)
-                    break
-                if resp.status_code != 200:
-                    print(f"Erro HTTP {resp.status_code} ao acessar {url}")
-                    print(resp.text)
-                    break
+        first_page = self._get_page(url, params, 1)
+        if not first_page:
+            return []
+
+        data = list(first_page)
+        if len(first_page) < PER_PAGE or MAX_PAGES == 1:
+            return data
 
-                page_data = resp.json()
+        with ThreadPoolExecutor(max_workers=MAX_PAGES - 1) as executor:
+            pages = executor.map(lambda page: self._get_page(url, params, page), range(2, MAX_PAGES + 1))
+            for page_data in pages:
                 if not page_data:
                     break
-
                 data.extend(page_data)
-                page += 1
-                time.sleep(0.5)  # gentileza com a API
-            except Exception as e:
-                print(f"Erro de conexão: {e}")
-                break
+                if len(page_data) < PER_PAGE:
+                    break
 
         return data
 
+    def _fetch_repo_comments(self, issues: List[dict]) -> Dict[int, List[dict]]:
+        """
+        Busca os comentários das issues listadas pelo endpoint do repositório (/issues/comments),
+        em poucas páginas de PER_PAGE em vez de uma requisição por issue, e os agrupa pelo número
+        da issue (extraído de issue_url).
+        Só vale a pena quando a busca, limitada a MAX_PAGES páginas, cobre todos os comentários do
+        conjunto e gasta menos requisições do que as buscas por issue que substitui; senão retorna {}.
+        """
+        budget = MAX_PAGES * PER_PAGE
+        total = sum(item.get("comments", 0) for item in issues)
+        commented = sum(1 for item in issues if item.get("comments", 0) > 0 and item.get("user"))
+        if not total or total > budget or commented <= -(-total // PER_PAGE):
+            return {}
+        # since filtra pela atualização do comentário: além dos comentários das issues listadas
+        # (todas criadas a partir da mais antiga), vêm comentários recentes de issues mais antigas.
+        # Em ordem decrescente de criação, os das issues listadas chegam antes dos criados antes de since
+        params = {"sort": "created", "direction": "desc"}
+        created = [item["created_at"] for item in issues if item.get("created_at")]
+        if created:
+            # Datas ISO 8601 em UTC: a comparação de strings segue a ordem cronológica
+            params["since"] = min(created)
+
+        # Agrupa pela própria issue_url (sem alterar os dicts dos comentários) e só converte
+        # cada URL no número da issue uma vez, em vez de uma vez por comentário
+        by_url: Dict[str, List[dict]] = {}
+        for comment in self._request(f"{self.base_url}/issues/comments", params):
+            issue_url = comment.get("issue_url")
+            if issue_url:
+                group = by_url.get(issue_url)
+                if group is None:
+                    group = by_url[issue_url] = []
+                group.append(comment)
+        # De volta à ordem crescente de criação, a mesma do endpoint de cada issue
+        return {int(issue_url.rsplit("/", 1)[1]): group[::-1] for issue_url, group in by_url.items()}
+
+    def _fetch_issue_details(self, item: dict, repo_comments: Dict[int, List[dict]] = None):
+        """
+        Busca os dados de uma issue que exigem requisições extras: comentários e,
+        para PRs, reviews e o detalhe do PR (merge). Executado nas threads de mine_data.
+        Os comentários vêm de repo_comments quando estão todos lá; senão, do endpoint da issue.
+        Retorna (comments, reviews, pr_data).
+        """
+        comments, reviews, pr_data = [], [], None
+        if not item.get("user"):
+            return comments, reviews, pr_data
+
+        # Comentários em issues ou PRs
+        count = item.get("comments", 0)
+        if count > 0:
+            comments = (repo_comments or {}).get(item["number"], [])
+            if len(comments) != count:
+                # Busca em lote incompleta (limite de MAX_PAGES páginas): usa o endpoint da issue
+                comments = self._request(item["comments_url"])
+
+        # Reviews e merges em PRs
+        if "pull_request" in item:
+            number = item["number"]
+            reviews = self._request(f"{self.base_url}/pulls/{number}/reviews")
+            # Detalhe do PR (merge), também com GET condicional; só merged_by é usado (e guardado no cache)
+            pr_data = self._get_json(f"{self.base_url}/pulls/{number}", fields=("merged_by",))
+
+        return comments, reviews, pr_data
+
+    def _record_interactions(self, creator_login: str, closer_login: str = None, comment_logins: Iterable[str] = (),
+                             reviewer_logins: Iterable[str] = (), merger_login: str = None):
+        """
+        Registra as interações de uma issue/PR com o autor: fechamento, comentários, reviews e merge,
+        nessa ordem (a ordem define os ids atribuídos aos usuários).
+        """
+        creator_id = self._get_user_id(creator_login)
+
+        if closer_login:
+            closer_id = self._get_user_id(closer_login)
+            if closer_id != creator_id:
+                self.raw_interactions.append((closer_id, creator_id, "close", WEIGHT_CLOSE))
+
+        # Comentários em issues ou PRs e reviews: o destino (autor) é o mesmo para o grupo todo,
+        # então cada grupo é gravado de uma vez no log
+        get_id = self._get_user_id
+        comment_ids = [uid for uid in map(get_id, comment_logins) if uid != creator_id]
+        if comment_ids:
+            self.raw_interactions.extend_to(creator_id, comment_ids, "comment", WEIGHT_COMMENT)
+
+        # Reviews
+        reviewer_ids = [uid for uid in map(get_id, reviewer_logins) if uid != creator_id]
+        if reviewer_ids:
+            self.raw_interactions.extend_to(creator_id, reviewer_ids, "review", WEIGHT_REVIEW)
+
+        # Merge
+        if merger_login:
+            merger_id = self._get_user_id(merger_login)
+            if merger_id != creator_id:
+                self.raw_interactions.append((merger_id, creator_id, "merge", WEIGHT_MERGE))
+
+    def _graphql(self, query: str, variables: dict):
+        """
+        Executa uma consulta na API GraphQL (v4) do GitHub. Retorna o campo "data" ou None em caso de erro.
+        """
+        try:
+            resp = self._send("POST", GRAPHQL_URL, json={"query": query, "variables": variables})
+            if resp.status_code != 200:
+                print(f"Erro HTTP {resp.status_code} ao acessar {GRAPHQL_URL}")
+                print(resp.text)
+                return None
+            payload = _json_loads(resp.content)
+            if payload.get("errors"):
+                print(f"Erro GraphQL: {payload['errors']}")
+                return None
+            return payload.get("data")
+        except Exception as e:
+            print(f"Erro de conexão: {e}")
+            return None
+
+    def _graphql_nodes(self, query: str, connection: str) -> Iterator[dict]:
+        """
+        Gera os nós de uma conexão do repositório ("issues" ou "pullRequests"), buscando a página
+        seguinte (cursor endCursor) só quando os nós da anterior foram consumidos.
+        Levanta _GraphQLError se alguma página falhar.
+        """
+        cursor = None
+        while True:
+            data = self._graphql(query, {"owner": self.repo_owner, "name": self.repo_name, "cursor": cursor})
+            if data is None or not data.get("repository"):
+                raise _GraphQLError(connection)
+            page = data["repository"][connection]
+            yield from page["nodes"]
+            if not page["pageInfo"]["hasNextPage"]:
+                return
+            cursor = page["pageInfo"]["endCursor"]
+
+    def _graphql_connection_logins(self, item: dict, type_: str, connection: str) -> List[str]:
+        """
+        Logins dos autores de uma conexão aninhada (comentários ou reviews) de um item.
+        A primeira página vem na consulta principal; as seguintes são buscadas pelo id do item,
+        até MAX_PAGES páginas no total, o mesmo limite do endpoint REST por issue.
+        Levanta _GraphQLError se alguma página falhar.
+        """
+        page = item[connection]
+        nodes = list(page["nodes"])
+        query = GRAPHQL_NESTED_QUERY % {"type": type_, "connection": connection}
+        for _ in range(MAX_PAGES - 1):
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            data = self._graphql(query, {"id": item["id"], "cursor": page["pageInfo"]["endCursor"]})
+            if data is None or not data.get("node"):
+                raise _GraphQLError(connection)
+            page = data["node"][connection]
+            nodes.extend(page["nodes"])
+        return _author_logins(nodes)
+
+    def _mine_graphql(self) -> bool:
+        """
+        Mineração via GraphQL: issues e PRs vêm com comentários, reviews, fechamento e merge
+        na mesma resposta, em vez de até 4 requisições REST por item. Requer token.
+        Produz o mesmo conjunto de dados da API REST: os MAX_PAGES * PER_PAGE itens mais recentes
+        (issues e PRs intercalados pela data de criação, como em /issues) e até MAX_PAGES páginas
+        de comentários e reviews por item.
+        Retorna False se a consulta falhar (nada é registrado nesse caso).
+        """
+        try:
+            # As duas conexões já vêm ordenadas por criação (decrescente): a intercalação
+            # só busca as páginas necessárias para completar o orçamento de itens
+            items = list(islice(heapq.merge(self._graphql_nodes(GRAPHQL_ISSUES_QUERY, "issues"),
+                                            self._graphql_nodes(GRAPHQL_PULLS_QUERY, "pullRequests"),
+                                            key=lambda node: node["createdAt"], reverse=True),
+                                MAX_PAGES * PER_PAGE))
+            details = []
+            for item in items:
+                if not item.get("author"):
+                    continue
+                is_pr = "reviews" in item
+                type_ = "PullRequest" if is_pr else "Issue"
+                comment_logins = self._graphql_connection_logins(item, type_, "comments")
+                reviewer_logins = self._graphql_connection_logins(item, type_, "reviews") if is_pr else []
+                details.append((item, is_pr, comment_logins, reviewer_logins))
+        except _GraphQLError:
+            return False
+        print(f"Total de issues retornadas: {len(items)}, PRs: {sum(1 for item in items if 'reviews' in item)}")
+
+        for item, is_pr, comment_logins, reviewer_logins in details:
+            closer_login = merger_login = None
+            if is_pr:
+                merger = item.get("mergedBy")
+                merger_login = merger["login"] if merger else None
+            elif item.get("state") == "CLOSED":
+                # Último evento de fechamento (equivalente ao closed_by da API REST)
+                closers = [node["actor"]["login"] for node in item["timelineItems"]["nodes"] if node and node.get("actor")]
+                closer_login = closers[-1] if closers else None
+            self._record_interactions(item["author"]["login"], closer_login, comment_logins,
+                                      reviewer_logins, merger_login)
+        return True
+
+    def _mine_rest(self):
+        """
+        Mineração via API REST: lista as issues e busca comentários, reviews e merges de cada uma.
+        """
+        issues = self._request(f"{self.base_url}/issues", {"state": "all"})
+        print(f"Total de issues retornadas: {len(issues)}")
+        repo_comments = self._fetch_repo_comments(issues)
+
+        # Comentários restantes, reviews e detalhes de PR são buscados em paralelo (I/O);
+        # as interações são registradas aqui, na ordem original, mantendo os ids determinísticos
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            details = executor.map(lambda item: self._fetch_issue_details(item, repo_comments), issues)
+            for item, (comments, reviews, pr_data) in zip(issues, details):
+                if not item.get("user"):
+                    continue
+                
+                is_pr = "pull_request" in item
+                closer_login = None
+                if (not is_pr) and item.get("state") == "closed" and item.get("closed_by"):
+                    closer_login = item["closed_by"]["login"]
+                merger_login = None
+                if pr_data and pr_data.get("merged_by"):
+                    merger_login = pr_data["merged_by"]["login"]
+
+                self._record_interactions(
+                    item["user"]["login"],
+                    closer_login,
+                    [comm["user"]["login"] for comm in comments if comm.get("user")],
+                    [rev["user"]["login"] for rev in reviews if rev.get("user")],
+                    merger_login,
+                )
+
     def mine_data(self):
         """
         Realiza a mineração completa: Issues, Comments, Pull Requests, Reviews.
+        Com token, usa a API GraphQL; sem token (ou se ela falhar), a API REST.
         """
         print(f"--- Iniciando Mineração em {self.repo_owner}/{self.repo_name} ---")
+        self._etag_used.clear()
+        self.load_etag_cache()
         
-        issues = self._request(f"{self.base_url}/issues", {"state": "all"})
-        print(f"Total de issues retornadas: {len(issues)}")
-
-        for item in issues:
-            if not item.get("user"):
-                continue
-            
-            creator_login = item["user"]["login"]
-            creator_id    = self._get_user_id(creator_login)
-            number        = item["number"]
-            is_pr         = "pull_request" in item
-            
-            if (not is_pr) and item.get("state") == "closed" and item.get("closed_by"):
-                closer_login = item["closed_by"]["login"]
-                closer_id    = self._get_user_id(closer_login)
-                if closer_id != creator_id:
-                    self.raw_interactions.append((closer_id, creator_id, "close", WEIGHT_CLOSE))
-
-            # Comentários em issues ou PRs
-            if item.get("comments", 0) > 0:
-                comments_url = item["comments_url"]
-                comments = self._request(comments_url)
-                for comm in comments:
-                    if not comm.get("user"):
-                        continue
-                    comm_login = comm["user"]["login"]
-                    comm_id    = self._get_user_id(comm_login)
-
-                    if comm_id != creator_id:
-                        self.raw_interactions.append((comm_id, creator_id, "comment", WEIGHT_COMMENT))
-
-            # Reviews e merges em PRs
-            if is_pr:
-                # Reviews
-                reviews_url = f"{self.base_url}/pulls/{number}/reviews"
-                reviews = self._request(reviews_url)
-                for rev in reviews:
-                    if not rev.get("user"):
-                        continue
-                    reviewer_login = rev["user"]["login"]
-                    reviewer_id    = self._get_user_id(reviewer_login)
-                    if reviewer_id != creator_id:
-                        self.raw_interactions.append((reviewer_id, creator_id, "review", WEIGHT_REVIEW))
-
-                # Merge
-                try:
-                    pr_resp = requests.get(f"{self.base_url}/pulls/{number}", headers=self.headers)
-                    print(f"GET {pr_resp.url} -> status {pr_resp.status_code}")
-                    if pr_resp.status_code == 200:
-                        pr_data = pr_resp.json()
-                        if pr_data.get("merged_by"):
-                            merger_login = pr_data["merged_by"]["login"]
-                            merger_id    = self._get_user_id(merger_login)
-                            if merger_id != creator_id:
-                                self.raw_interactions.append((merger_id, creator_id, "merge", WEIGHT_MERGE))
-                except Exception as e:
-                    print(f"Erro ao buscar detalhe do PR {number}: {e}")
+        if not (self.token and self._mine_graphql()):
+            self._mine_rest()
+        self.save_etag_cache()
 
         print(f"Mineração concluída. Total de interações capturadas: {len(self.raw_interactions)}")
         if self.raw_interactions:
@@ -144,28 +718,81 @@ class GitHubMiner:
             print("\nSalvando dados automaticamente...")
             self.save_data_to_json()
 
-    def _build_graph_from_interactions(self, interaction_types: List[str] = None) -> AbstractGraph:
-        graph = AdjacencyListGraph(self.next_id)
+    def _graph_from_edge_weights(self, edge_weights: Dict[int, float]) -> AbstractGraph:
+        """
+        Monta o grafo rotulado a partir dos pesos acumulados (chave u * n + v) via CSR,
+        em vez de inserir aresta por aresta. A ordem dos vizinhos segue a ordem de inserção.
+        """
+        n = self.next_id
+        # Counting sort estável das chaves pela origem u
+        rows = [key // n for key in edge_weights]
+        counts = [0] * (n + 1)
+        for u in rows:
+            counts[u + 1] += 1
+        indptr = array('q', accumulate(counts))
+        pos = indptr.tolist()
+        indices = array('i', bytes(4 * len(rows)))
+        weights = array('d', bytes(8 * len(rows)))
+        for u, key, weight in zip(rows, edge_weights, edge_weights.values()):
+            p = pos[u]
+            indices[p] = key - u * n
+            weights[p] = weight
+            pos[u] = p + 1
+        graph = AdjacencyListGraph.fromCSR(n, indptr, indices, weights)
         
-        inv_map = {v: k for k, v in self.user_map.items()}
-        for uid, login in inv_map.items():
+        for uid, login in enumerate(self.user_logins):
             graph.set_vertex_label(uid, login)
-            
-        edge_weights: Dict[Tuple[int, int], float] = {}
+        return graph
+
+    def _build_graph_from_interactions(self, interaction_types: List[str] = None) -> AbstractGraph:
+        wanted = {TYPE_CODES[t] for t in interaction_types} if interaction_types else None
+        n = self.next_id
+        log = self.raw_interactions
+        # Pesos acumulados por aresta, com a chave codificada como u * n + v (sem tuplas por interação);
+        # dict com get pré-vinculado: mais rápido que Counter ou defaultdict neste laço
+        edge_weights: Dict[int, float] = {}
+        get_weight = edge_weights.get
         
-        for u, v, type_, weight in self.raw_interactions:
-            if interaction_types and type_ not in interaction_types:
-                continue
+        if wanted is None:
+            for u, v, weight in zip(log.src, log.dst, log.weights):
+                key = u * n + v
+                edge_weights[key] = get_weight(key, 0.0) + weight
+        else:
+            # Filtro por tipo feito em C: bytes.translate gera a máscara (1 byte por interação)
+            # e compress descarta as demais, sem teste de pertinência no laço Python
+            table = bytes(code in wanted for code in range(256))
+            mask = log.types.tobytes().translate(table)
+            for u, v, weight in compress(zip(log.src, log.dst, log.weights), mask):
+                key = u * n + v
+                edge_weights[key] = get_weight(key, 0.0) + weight
 
-            if (u, v) not in edge_weights:
-                edge_weights[(u, v)] = 0.0
-            edge_weights[(u, v)] += weight
+        return self._graph_from_edge_weights(edge_weights)
 
-        for (u, v), w in edge_weights.items():
-            graph.addEdge(u, v)
-            graph.setEdgeWeight(u, v, w)
-            
-        return graph
+    def build_graphs(self, groups: Dict[str, List[str]] = None) -> Dict[str, AbstractGraph]:
+        """
+        Constrói vários grafos numa única passada pelas interações, em vez de uma por grafo.
+        groups mapeia nome -> tipos de interação (None = todos); o padrão é GRAPH_GROUPS
+        (os três grafos por tipo e o integrado). O resultado é o mesmo das funções get_graph_*.
+        """
+        if groups is None:
+            groups = GRAPH_GROUPS
+        n = self.next_id
+        log = self.raw_interactions
+
+        accumulators: Dict[str, Dict[int, float]] = {name: {} for name in groups}
+        # Para cada código de tipo, os acumuladores (grafos) que recebem a interação
+        targets: List[List[Dict[int, float]]] = [[] for _ in INTERACTION_TYPES]
+        for name, types in groups.items():
+            codes = {TYPE_CODES[t] for t in types} if types else range(len(INTERACTION_TYPES))
+            for code in codes:
+                targets[code].append(accumulators[name])
+
+        for u, v, code, weight in zip(log.src, log.dst, log.types, log.weights):
+            key = u * n + v
+            for edge_weights in targets[code]:
+                edge_weights[key] = edge_weights.get(key, 0.0) + weight
+
+        return {name: self._graph_from_edge_weights(edge_weights) for name, edge_weights in accumulators.items()}
 
     def get_graph_1_comments(self) -> AbstractGraph:
         return self._build_graph_from_interactions(["comment"])
@@ -179,9 +806,11 @@ class GitHubMiner:
     def get_grafo_integrado(self) -> AbstractGraph:
         return self._build_graph_from_interactions(None)
 
-    def save_data_to_json(self, filename: str = None):
+    def save_data_to_json(self, filename: str = None, pretty: bool = False):
         """
         Salva os dados minerados em um arquivo JSON para reutilização posterior.
+        O arquivo é compacto (sem indentação e espaços), pois é lido pelo programa;
+        pretty=True grava indentado, para inspeção manual.
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -193,21 +822,106 @@ class GitHubMiner:
             "timestamp": datetime.now().isoformat(),
             "user_map": self.user_map,
             "next_id": self.next_id,
-            "raw_interactions": self.raw_interactions
+            "raw_interactions": self.raw_interactions.to_list()
         }
         
+        # Escrita atômica: serializa uma vez, grava em arquivo temporário e troca com os.replace,
+        # para que um Ctrl+C no meio do salvamento não deixe um JSON truncado
+        tmp_filename = filename + ".tmp"
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
+            payload = _json_dumps(data_to_save, indent=pretty)
+            with open(tmp_filename, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+            os.replace(tmp_filename, filename)
             print(f"Dados salvos em: {filename}")
             return filename
         except Exception as e:
             print(f"Erro ao salvar dados: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
             return None
 
+    def save_data_to_npz(self, filename: str = None):
+        """
+        Salva os dados minerados em formato binário: as colunas do InteractionLog como .npy
+        (carregáveis com numpy.load) e os metadados e logins em metadata.json, no mesmo .npz.
+        Bem menor e mais rápido de ler e gravar que o JSON; load_data_from_json reconhece a extensão.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"github_data_{self.repo_owner}_{self.repo_name}_{timestamp}.npz"
+        
+        metadata = {
+            "repo_owner": self.repo_owner,
+            "repo_name": self.repo_name,
+            "timestamp": datetime.now().isoformat(),
+            "next_id": self.next_id,
+            "interaction_types": list(INTERACTION_TYPES),
+            "user_logins": self.user_logins,
+        }
+        log = self.raw_interactions
+        
+        # Escrita atômica, como em save_data_to_json
+        tmp_filename = filename + ".tmp"
+        try:
+            with zipfile.ZipFile(tmp_filename, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("metadata.json", _json_dumps(metadata))
+                for name, column in (("src", log.src), ("dst", log.dst), ("types", log.types), ("weights", log.weights)):
+                    zf.writestr(f"{name}.npy", _npy_bytes(column, (len(column),)))
+            os.replace(tmp_filename, filename)
+            print(f"Dados salvos em: {filename}")
+            return filename
+        except Exception as e:
+            print(f"Erro ao salvar dados: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            return None
+
+    def _etag_cache_filename(self) -> str:
+        return ETAG_CACHE_FILE.format(owner=self.repo_owner, repo=self.repo_name)
+
+    def save_etag_cache(self, filename: str = None):
+        """
+        Persiste o cache de ETags para que a próxima mineração use GET condicional.
+        Grava só as entradas usadas nesta mineração (no máximo ETAG_CACHE_MAX_ENTRIES, na ordem de uso).
+        """
+        cache = self._etag_cache
+        kept = {key: cache[key] for key in islice((key for key in self._etag_used if key in cache),
+                                                  ETAG_CACHE_MAX_ENTRIES)}
+        if not kept:
+            return
+        filename = filename or self._etag_cache_filename()
+        tmp_filename = filename + ".tmp"
+        try:
+            payload = _json_dumps(kept)
+            with open(tmp_filename, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+            os.replace(tmp_filename, filename)
+        except Exception as e:
+            print(f"Erro ao salvar cache de ETags: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+    def load_etag_cache(self, filename: str = None):
+        """
+        Carrega o cache de ETags salvo por uma mineração anterior deste repositório, se existir.
+        """
+        filename = filename or self._etag_cache_filename()
+        if not os.path.exists(filename):
+            return
+        try:
+            with open(filename, 'rb') as f:
+                cache = _json_loads(f.read())
+            # Entradas da sessão atual têm prioridade sobre as do arquivo
+            loaded = {key: (etag, data) for key, (etag, data) in cache.items()}
+            loaded.update(self._etag_cache)
+            self._etag_cache = loaded
+        except Exception as e:
+            print(f"Erro ao carregar cache de ETags: {e}")
+
     def load_data_from_json(self, filename: str) -> bool:
         """
-        Carrega dados previamente minerados de um arquivo JSON.
+        Carrega dados previamente minerados de um arquivo JSON (ou .npz, de save_data_to_npz).
         Retorna True se carregado com sucesso, False caso contrário.
         """
         try:
@@ -215,8 +929,16 @@ class GitHubMiner:
                 print(f"Arquivo não encontrado: {filename}")
                 return False
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if filename.endswith('.npz'):
+                data = _load_saved_data_npz(filename)
+            else:
+                try:
+                    # Com ijson, o arquivo é lido em fluxo: o pico de memória não cresce com a lista de interações
+                    with open(filename, 'rb') as f:
+                        data = _load_saved_data_streaming(f)
+                except ImportError:
+                    with open(filename, 'rb') as f:
+                        data = _json_loads(f.read())
             
             # Verificar se é o mesmo repositório
             if (data.get("repo_owner") != self.repo_owner or 
@@ -231,7 +953,10 @@ class GitHubMiner:
             # Carregar os dados
             self.user_map = data.get("user_map", {})
             self.next_id = data.get("next_id", 0)
-            self.raw_interactions = data.get("raw_interactions", [])
+            self.user_logins = sorted(self.user_map, key=self.user_map.__getitem__)
+            interactions = data.get("raw_interactions", [])
+            self.raw_interactions = (interactions if isinstance(interactions, InteractionLog)
+                                     else InteractionLog(interactions))
             
             print(f"Dados carregados com sucesso!")
             print(f"Timestamp do arquivo: {data.get('timestamp', 'N/A')}")
@@ -246,15 +971,16 @@ class GitHubMiner:
 
     def list_saved_files(self) -> List[str]:
         """
-        Lista arquivos JSON salvos no diretório atual que correspondem ao padrão de nomenclatura.
+        Lista arquivos salvos (JSON ou .npz) no diretório atual que correspondem ao padrão de nomenclatura.
         """
         pattern = f"github_data_{self.repo_owner}_{self.repo_name}"
         files = []
         
         try:
-            for filename in os.listdir('.'):
-                if filename.startswith(pattern) and filename.endswith('.json'):
-                    files.append(filename)
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if entry.name.startswith(pattern) and entry.name.endswith(('.json', '.npz')) and entry.is_file():
+                        files.append(entry.name)
             files.sort(reverse=True)  # Mais recentes primeiro
         except Exception as e:
             print(f"Erro ao listar arquivos: {e}")
@@ -274,8 +1000,8 @@ class GitHubMiner:
         }
         
         try:
-            with open("github_config.json", 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            with open("github_config.json", 'wb') as f:
+                f.write(_json_dumps(config_data, indent=True))
             print("Configuração salva em github_config.json")
             return True
         except Exception as e:
@@ -292,8 +1018,8 @@ class GitHubMiner:
             if not os.path.exists("github_config.json"):
                 return None
                 
-            with open("github_config.json", 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open("github_config.json", 'rb') as f:
+                config = _json_loads(f.read())
             
             # Validar campos obrigatórios
             if not config.get("repo_owner") or not config.get("repo_name"):
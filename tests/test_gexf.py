@@ -0,0 +1,56 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+from graph_lib.adjacency_list import AdjacencyListGraph
+from graph_lib.adjacency_matrix import AdjacencyMatrixGraph
+
+GEXF_NS = "http://www.gexf.net/1.2draft"
+
+def _export(graph, directory: str) -> str:
+    path = os.path.join(directory, "grafo.gexf")
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph.exportToGEXF(path)
+    return path
+
+def _sample(cls):
+    graph = cls(3)
+    graph.set_vertex_label(0, "ana")
+    graph.set_vertex_label(1, "<bia & cia>")
+    graph.set_vertex_label(2, "caio")
+    graph.setVertexWeight(2, 1.5)
+    graph.addEdge(0, 1)
+    graph.addEdge(1, 2)
+    graph.setEdgeWeight(1, 2, 3.0)
+    return graph
+
+class ExportToGEXFTest(unittest.TestCase):
+    def test_root_namespace_and_contents(self):
+        for cls in (AdjacencyListGraph, AdjacencyMatrixGraph):
+            with self.subTest(backend=cls.__name__), tempfile.TemporaryDirectory() as directory:
+                root = ET.parse(_export(_sample(cls), directory)).getroot()
+                self.assertEqual(root.tag, f"{{{GEXF_NS}}}gexf")
+                self.assertEqual(root.get("version"), "1.2")
+                nodes = root.findall(f".//{{{GEXF_NS}}}node")
+                self.assertEqual([node.get("label") for node in nodes], ["ana", "<bia & cia>", "caio"])
+                edges = {(e.get("source"), e.get("target")): float(e.get("weight"))
+                         for e in root.iter(f"{{{GEXF_NS}}}edge")}
+                self.assertEqual(edges, {("0", "1"): 1.0, ("1", "2"): 3.0})
+
+    def test_round_trip_networkx(self):
+        try:
+            import networkx as nx
+        except ImportError:
+            self.skipTest("networkx não instalado")
+        with tempfile.TemporaryDirectory() as directory:
+            loaded = nx.read_gexf(_export(_sample(AdjacencyListGraph), directory))
+        self.assertTrue(loaded.is_directed())
+        self.assertEqual(loaded.number_of_nodes(), 3)
+        self.assertEqual(loaded["1"]["2"]["weight"], 3.0)
+        self.assertEqual(loaded.nodes["2"]["Weight"], 1.5)
+
+if __name__ == "__main__":
+    unittest.main()